@@ -34,6 +34,10 @@ class ArtifactType(Enum):
     LANGEXTRACT = "LANGEXTRACT"
 
 
+# str() of every ArtifactType, computed once instead of going through Enum.__str__ per call
+_ARTIFACT_TYPE_NAMES: Dict[ArtifactType, str] = {artifact_type: str(artifact_type) for artifact_type in ArtifactType}
+
+
 class ChunkMetadata(BaseModel):
     chunk_index: int = Field(default=0, description="Chunk index")
     chunk_size: int = Field(default=0, description="Chunk size")
@@ -251,6 +255,44 @@ class Artifact(BaseModel):
             artifact.attachment_files = {file_id: AttachmentFile.model_validate(file) if isinstance(file, dict) else file for file_id,file in artifact.attachment_files.items()}
         return artifact
 
+    @classmethod
+    def from_trusted_dict(cls, data: Dict[str, Any]) -> Optional["Artifact"]:
+        """
+        Restore an artifact written by to_dict without running pydantic validation.
+        Only for data this package stored itself, use from_dict for untrusted input.
+        Args:
+            data: Dictionary data produced by to_dict
+        Returns:
+            Artifact instance or None if artifact_id is not present
+        """
+        if not data.get("artifact_id"):
+            return None
+        content = data.get("content")
+        version_history = data.get("version_history")
+        if not version_history:
+            # the initial version from_dict gets from setup_artifact
+            version_history = [{
+                "timestamp": datetime.now().isoformat(),
+                "description": "Initial version",
+                "content": content,
+                "status": ArtifactStatus.DRAFT
+            }]
+        artifact = cls.model_construct(
+            artifact_id=data["artifact_id"],
+            parent_id=data.get("parent_id"),
+            artifact_type=ArtifactType(data.get("artifact_type")),
+            content=content,
+            metadata=data.get("metadata") or {},
+            created_at=data.get("created_at"),
+            updated_at=data.get("updated_at"),
+            status=ArtifactStatus[data.get("status")],
+            version_history=version_history,
+            sublist=[cls.from_trusted_dict(sub) for sub in data.get("sublist") or ()]
+        )
+        if artifact.attachment_files:
+            artifact.attachment_files = {file_id: AttachmentFile.model_validate(file) if isinstance(file, dict) else file for file_id,file in artifact.attachment_files.items()}
+        return artifact
+
     def add_subartifact(self, subartifact: 'Artifact') -> None:
         """
         Add a subartifact (child artifact) to this artifact.
@@ -267,6 +309,13 @@ class Artifact(BaseModel):
             return None
         return str(self.content)
 
+    @property
+    def artifact_type_str(self) -> str:
+        """
+        str(artifact_type), served from a precomputed table
+        """
+        return _ARTIFACT_TYPE_NAMES.get(self.artifact_type) or str(self.artifact_type)
+
     def get_reranked_text(self) -> Optional[str]:
         """
         Get the reranked text for the artifact.
@@ -71,10 +71,7 @@ class BasePDFArtifact(Artifact):
         if pdf_doc is None:
             return "Unable to retrieve the article from arXiv.org."
         pymupdf_doc = fitz.open(stream=pdf_doc, filetype="pdf")
-        content = ""
-        for page in pymupdf_doc:
-            content += page.get_text()
-        return content
+        return "".join(page.get_text() for page in pymupdf_doc)
 
     async def process_pdf_to_markdown(self,
                                       pdf_path: str,
@@ -189,7 +189,7 @@ class ArtifactFactory:
                                     **kwargs)
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> Optional[Artifact]:
+    def from_dict(cls, data: Dict[str, Any], trusted: bool = False) -> Optional[Artifact]:
         """
         restore an Artifact instance
         
@@ -199,6 +199,8 @@ class ArtifactFactory:
         
         Args:
             data (Dict[str, Any]): the dictionary data containing artifact information
+            trusted (bool): the data was written by Artifact.to_dict, restore it without pydantic validation
+                unless the artifact class has its own from_dict
             
         Returns:
             Optional[Artifact]: the created artifact instance with the correct subclass type, if the artifact_id does not exist, return None
@@ -225,14 +227,17 @@ class ArtifactFactory:
 
         # Check if artifact type is supported
         if artifact_type not in cls._artifact_classes:
-            return Artifact.from_dict(data)
+            return Artifact.from_trusted_dict(data) if trusted else Artifact.from_dict(data)
 
         try:
             # Get the appropriate artifact class
             artifact_class = cls._artifact_classes[artifact_type]
 
+            if trusted and artifact_class.from_dict.__func__ is Artifact.from_dict.__func__:
+                # no special from_dict, the generic restore applies and can skip validation
+                artifact = artifact_class.from_trusted_dict(data)
             # Check if there is a special from_dict static method
-            if hasattr(artifact_class, 'from_dict') and callable(
+            elif hasattr(artifact_class, 'from_dict') and callable(
                     getattr(artifact_class, 'from_dict')):
                 # Use the class's own from_dict method to create an instance
                 artifact = artifact_class.from_dict(data)
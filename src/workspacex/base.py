@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic import Field, BaseModel
 
 from workspacex.chunk.base import ChunkConfig
@@ -8,8 +10,9 @@ from workspacex.config import CHROMA_CLIENT_AUTH_PROVIDER, \
 from workspacex.config import WORKSPACEX_CHUNK_OVERLAP, WORKSPACEX_CHUNK_SIZE, WORKSPACEX_CHUNK_TEXT_SPLITTER, \
     WORKSPACEX_EMBEDDING_API_BASE_URL, WORKSPACEX_EMBEDDING_API_KEY, WORKSPACEX_EMBEDDING_BATCH_SIZE, \
     WORKSPACEX_EMBEDDING_CONTEXT_LENGTH, WORKSPACEX_EMBEDDING_DIMENSIONS, WORKSPACEX_EMBEDDING_MODEL, \
-    WORKSPACEX_EMBEDDING_PROVIDER, WORKSPACEX_EMBEDDING_TIMEOUT, WORKSPACEX_ENABLE_HYBRID_SEARCH, \
-    WORKSPACEX_HYBRID_SEARCH_THRESHOLD, WORKSPACEX_HYBRID_SEARCH_TOP_K, WORKSPACEX_VECTOR_DB_PROVIDER, \
+    WORKSPACEX_EMBEDDING_PROVIDER, WORKSPACEX_EMBEDDING_TIMEOUT, WORKSPACEX_EMBEDDING_CACHE_PATH, WORKSPACEX_ENABLE_HYBRID_SEARCH, \
+    WORKSPACEX_HYBRID_SEARCH_THRESHOLD, WORKSPACEX_HYBRID_SEARCH_TOP_K, WORKSPACEX_HYBRID_SEARCH_RERANK_BATCH_SIZE, \
+    WORKSPACEX_HYBRID_SEARCH_RERANK_MAX_CONCURRENCY, WORKSPACEX_HYBRID_SEARCH_SKIP_RERANK_THRESHOLD, WORKSPACEX_VECTOR_DB_PROVIDER, \
     WORKSPACEX_ENABLE_CHUNKING, WORKSPACEX_ENABLE_EMBEDDING, WORKSPACEX_FULLTEXT_DB_PROVIDER, ELASTICSEARCH_HOSTS, \
     ELASTICSEARCH_USERNAME, ELASTICSEARCH_PASSWORD, \
     ELASTICSEARCH_INDEX_PREFIX, ELASTICSEARCH_NUMBER_OF_SHARDS, ELASTICSEARCH_NUMBER_OF_REPLICAS
@@ -23,6 +26,9 @@ class HybridSearchConfig(BaseModel):
     enabled: bool = Field(default=False, description="enabled flag")
     top_k: int = Field(default=10, description="Top K results")
     threshold: float = Field(default=0.8, description="Threshold for similarity search")
+    rerank_batch_size: int = Field(default=0, description="Candidates per reranker call, 0 reranks all candidates in one call")
+    rerank_max_concurrency: int = Field(default=4, description="Max concurrent reranker calls when candidates are batched")
+    skip_rerank_threshold: Optional[float] = Field(default=None, description="Min score of a lone search branch's results to return them without reranking, None always reranks")
     
     @classmethod
     def from_config(cls, config: dict):
@@ -32,13 +38,19 @@ class HybridSearchConfig(BaseModel):
         Args:
             config (dict): Configuration dictionary containing the following keys:
                 - enabled (bool): Whether hybrid search is enabled
+                - rerank_batch_size (int): Candidates per reranker call, 0 for a single call
+                - rerank_max_concurrency (int): Max concurrent reranker calls
+                - skip_rerank_threshold (float): Min score to skip reranking a lone search branch's results
         """
         if not config:
             return None
         return cls(
             enabled=config.get("enabled", False),
             top_k=config.get("top_k", 10),
-            threshold=config.get("threshold", 0.8)
+            threshold=config.get("threshold", 0.8),
+            rerank_batch_size=config.get("rerank_batch_size", 0),
+            rerank_max_concurrency=config.get("rerank_max_concurrency", 4),
+            skip_rerank_threshold=config.get("skip_rerank_threshold")
         )
 
 class WorkspaceConfig:
@@ -73,6 +85,7 @@ class WorkspaceConfig:
                 provider=WORKSPACEX_EMBEDDING_PROVIDER,
                 api_key=WORKSPACEX_EMBEDDING_API_KEY,
                 base_url=WORKSPACEX_EMBEDDING_API_BASE_URL,
+                cache_path=WORKSPACEX_EMBEDDING_CACHE_PATH or None,
             )
         else:
             self.embedding_config = embedding_config
@@ -87,7 +100,8 @@ class WorkspaceConfig:
                 context_length=WORKSPACEX_EMBEDDING_CONTEXT_LENGTH,
                 dimensions=WORKSPACEX_EMBEDDING_DIMENSIONS,
                 batch_size=WORKSPACEX_EMBEDDING_BATCH_SIZE,
-                timeout=WORKSPACEX_EMBEDDING_TIMEOUT
+                timeout=WORKSPACEX_EMBEDDING_TIMEOUT,
+                cache_path=WORKSPACEX_EMBEDDING_CACHE_PATH or None
             )
         else:
             self.embedding_config = embedding_config
@@ -116,7 +130,10 @@ class WorkspaceConfig:
             self.hybrid_search_config = HybridSearchConfig(
                 enabled=WORKSPACEX_ENABLE_HYBRID_SEARCH,
                 top_k=WORKSPACEX_HYBRID_SEARCH_TOP_K,
-                threshold=WORKSPACEX_HYBRID_SEARCH_THRESHOLD
+                threshold=WORKSPACEX_HYBRID_SEARCH_THRESHOLD,
+                rerank_batch_size=WORKSPACEX_HYBRID_SEARCH_RERANK_BATCH_SIZE,
+                rerank_max_concurrency=WORKSPACEX_HYBRID_SEARCH_RERANK_MAX_CONCURRENCY,
+                skip_rerank_threshold=WORKSPACEX_HYBRID_SEARCH_SKIP_RERANK_THRESHOLD
             )
         else:
             self.hybrid_search_config = hybrid_search_config
@@ -31,6 +31,8 @@ WORKSPACEX_EMBEDDING_CONTEXT_LENGTH = os.environ.get("WORKSPACEX_EMBEDDING_CONTE
 WORKSPACEX_EMBEDDING_DIMENSIONS = os.environ.get("WORKSPACEX_EMBEDDING_DIMENSIONS", "1024")
 WORKSPACEX_EMBEDDING_BATCH_SIZE = os.environ.get("WORKSPACEX_EMBEDDING_BATCH_SIZE", "100")
 WORKSPACEX_EMBEDDING_TIMEOUT = os.environ.get("WORKSPACEX_EMBEDDING_TIMEOUT", "60")
+# content-hash -> embedding cache reused across re-indexing, opt-in: set a SQLite file path (e.g. f"{DATA_DIR}/embedding_cache.db")
+WORKSPACEX_EMBEDDING_CACHE_PATH = os.environ.get("WORKSPACEX_EMBEDDING_CACHE_PATH", "")
 
 ####################################
 # Config for Vector Database
@@ -68,6 +70,9 @@ if WORKSPACEX_VECTOR_DB_PROVIDER == "chroma":
 WORKSPACEX_ENABLE_HYBRID_SEARCH = os.environ.get("WORKSPACEX_ENABLE_HYBRID_SEARCH", "").lower() == "true"
 WORKSPACEX_HYBRID_SEARCH_TOP_K = os.environ.get("WORKSPACEX_HYBRID_SEARCH_TOP_K", "10")
 WORKSPACEX_HYBRID_SEARCH_THRESHOLD = os.environ.get("WORKSPACEX_HYBRID_SEARCH_THRESHOLD", "0.5")
+WORKSPACEX_HYBRID_SEARCH_RERANK_BATCH_SIZE = os.environ.get("WORKSPACEX_HYBRID_SEARCH_RERANK_BATCH_SIZE", "0")
+WORKSPACEX_HYBRID_SEARCH_RERANK_MAX_CONCURRENCY = os.environ.get("WORKSPACEX_HYBRID_SEARCH_RERANK_MAX_CONCURRENCY", "4")
+WORKSPACEX_HYBRID_SEARCH_SKIP_RERANK_THRESHOLD = os.environ.get("WORKSPACEX_HYBRID_SEARCH_SKIP_RERANK_THRESHOLD") or None
 
 
 ####################################
@@ -7,8 +7,12 @@ from typing import List, Optional
 from pydantic import BaseModel, ConfigDict, Field
 
 from workspacex.artifact import Artifact, Chunk, SummaryArtifact
+from workspacex.embedding.cache import EmbeddingCache
 from workspacex.utils.logger import logger
 
+# max batch requests async_embed_texts keeps in flight, large rebuilds would otherwise hit provider rate limits
+ASYNC_EMBED_MAX_CONCURRENCY = 4
+
 
 class EmbeddingsConfig(BaseModel):
     enabled: bool = False
@@ -20,6 +24,7 @@ class EmbeddingsConfig(BaseModel):
     dimensions: int = 1536
     batch_size: int = 100
     timeout: int = 60
+    cache_path: Optional[str] = None
     
     @classmethod
     def from_config(cls, config: dict):
@@ -34,7 +39,8 @@ class EmbeddingsConfig(BaseModel):
             context_length=config.get("context_length", 8191),
             dimensions=config.get("dimensions", 1536),
             batch_size=config.get("batch_size", 100),
-            timeout=config.get("timeout", 60)
+            timeout=config.get("timeout", 60),
+            cache_path=config.get("cache_path")
         )
 
 class EmbeddingsMetadata(BaseModel):
@@ -128,6 +134,12 @@ class EmbeddingsBase(Embeddings):
             config (EmbeddingsConfig): Configuration for embedding model and API.
         """
         self.config = config
+        self.cache = EmbeddingCache(config.cache_path) if config.cache_path else None
+
+    @property
+    def cache_model_key(self) -> str:
+        """Cache namespace, embeddings of the same text differ between models and dimensions"""
+        return f"{self.config.provider}:{self.config.model_name}:{self.config.dimensions}"
 
     def embed_artifacts(self, artifacts: List[Artifact]) -> List[EmbeddingsResult]:
         """
@@ -163,7 +175,7 @@ class EmbeddingsBase(Embeddings):
         """
         if isinstance(artifact, SummaryArtifact):
             return self._embed_summary_artifact(artifact)
-        embedding = self.embed_query(artifact.get_embedding_text())
+        embedding = self._embed_text_cached(artifact.get_embedding_text())
         now = int(time.time())
         metadata = EmbeddingsMetadata(
             artifact_id=artifact.artifact_id,
@@ -188,7 +200,7 @@ class EmbeddingsBase(Embeddings):
         Returns:
             EmbeddingsResult: Embedding result for the artifact.
         """
-        embedding = self.embed_query(artifact.get_embedding_text())
+        embedding = self._embed_text_cached(artifact.get_embedding_text())
         now = int(time.time())
         metadata = EmbeddingsMetadata(
             artifact_id=artifact.origin_artifact.artifact_id,
@@ -218,13 +230,18 @@ class EmbeddingsBase(Embeddings):
 
     async def async_embed_artifacts(self, artifacts: List[Artifact]) -> List[EmbeddingsResult]:
         """
-        Asynchronously embed a list of artifacts.
+        Asynchronously embed a list of artifacts, their texts go to the embedder in one batched call.
         Args:
             artifacts (List[Artifact]): List of artifacts to embed.
         Returns:
-            List[EmbeddingsResult]: List of embedding results.
-        """
-        return await asyncio.gather(*[self._async_embed_artifact(artifact) for artifact in artifacts])
+            List[EmbeddingsResult]: List of embedding results, in the order of artifacts.
+        """
+        if not artifacts:
+            return []
+        texts = [artifact.get_embedding_text() for artifact in artifacts]
+        embeddings = await self._async_embed_texts_cached(texts, "async_embed_artifacts")
+        return [self._artifact_embedding_result(artifact, text, embedding)
+                for artifact, text, embedding in zip(artifacts, texts, embeddings)]
     
     async def async_embed_artifact(self, artifact: Artifact) -> EmbeddingsResult:
         """
@@ -302,6 +319,71 @@ class EmbeddingsBase(Embeddings):
         """
         pass
 
+    async def async_embed_texts(self, texts: List[str]) -> List[List[float]]:
+        """
+        Asynchronously embed several texts.
+        Providers whose API accepts a list of inputs should override this to send batched requests.
+        Args:
+            texts (List[str]): Texts to embed.
+        Returns:
+            List[List[float]]: Embedding vectors, in the order of texts.
+        """
+        return await asyncio.gather(*[self.async_embed_query(text) for text in texts])
+
+    def _embed_text_cached(self, text: str) -> List[float]:
+        """
+        Embed a text, reusing the cached embedding of the same content if there is one.
+        Args:
+            text (str): Text to embed.
+        Returns:
+            List[float]: Embedding vector.
+        """
+        if not self.cache:
+            return self.embed_query(text)
+        content_hash = EmbeddingCache.content_hash(text)
+        embedding = self.cache.get(self.cache_model_key, content_hash)
+        if embedding is None:
+            embedding = self.embed_query(text)
+            self.cache.put_many(self.cache_model_key, [(content_hash, embedding)])
+        return embedding
+
+    async def _async_embed_texts_cached(self, texts: List[str], caller: str) -> List[List[float]]:
+        """
+        Asynchronously embed several texts, only texts missing from the cache are sent to the embedder.
+        Args:
+            texts (List[str]): Texts to embed.
+            caller (str): Name of the calling method, used as log label.
+        Returns:
+            List[List[float]]: Embedding vectors, in the order of texts.
+        """
+        if not self.cache:
+            return await self._async_embed_texts_by_length(texts)
+        hashes = [EmbeddingCache.content_hash(text) for text in texts]
+        embeddings = await asyncio.to_thread(self.cache.get_many, self.cache_model_key, hashes)
+        misses = {content_hash: text for content_hash, text in zip(hashes, texts) if content_hash not in embeddings}
+        logger.info(f"[{caller}] embedding cache hits {len(texts) - len(misses)}/{len(texts)}")
+        if misses:
+            computed = dict(zip(misses, await self._async_embed_texts_by_length(list(misses.values()))))
+            await asyncio.to_thread(self.cache.put_many, self.cache_model_key, computed.items())
+            embeddings.update(computed)
+        return [embeddings[content_hash] for content_hash in hashes]
+
+    async def _async_embed_texts_by_length(self, texts: List[str]) -> List[List[float]]:
+        """
+        Asynchronously embed several texts, sorted by length so each provider batch holds texts of similar length.
+        Batches are padded to their longest input, mixing short and long texts wastes most of that compute.
+        Args:
+            texts (List[str]): Texts to embed.
+        Returns:
+            List[List[float]]: Embedding vectors, in the order of texts.
+        """
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        sorted_embeddings = await self.async_embed_texts([texts[i] for i in order])
+        embeddings: List[Optional[List[float]]] = [None] * len(texts)
+        for i, embedding in zip(order, sorted_embeddings):
+            embeddings[i] = embedding
+        return embeddings
+
     def embed_chunks(self, chunks: List[Chunk]) -> List[EmbeddingsResult]:
         """
         Embed a list of chunks.
@@ -356,12 +438,40 @@ class EmbeddingsBase(Embeddings):
         # 🚀 Start embedding chunks
         logger.info("[async_embed_chunks]  Start embedding {} chunks...".format(len(chunks)))
         start_time = time.time()
-        results = await asyncio.gather(*[self._async_embed_chunk(chunk) for chunk in chunks])
+        embeddings = await self._async_embed_texts_cached([chunk.content for chunk in chunks], "async_embed_chunks")
+        results = [self._chunk_embedding_result(chunk, embedding) for chunk, embedding in zip(chunks, embeddings)]
         elapsed = time.time() - start_time
         # ✅ Embedding finished
         logger.info(f"[async_embed_chunks] ✅ Finished embedding {len(chunks)} chunks in {elapsed:.2f} seconds.")
         return results
     
+    def _artifact_embedding_result(self, artifact: Artifact, text: str, embedding: List[float]) -> EmbeddingsResult:
+        """
+        Wrap the embedding of an artifact into an EmbeddingsResult, summaries are attributed to their origin artifact.
+        Args:
+            artifact (Artifact): The embedded artifact.
+            text (str): The embedded text of the artifact.
+            embedding (List[float]): Embedding vector of the text.
+        Returns:
+            EmbeddingsResult: Embedding result for the artifact.
+        """
+        origin = artifact.origin_artifact if isinstance(artifact, SummaryArtifact) else artifact
+        now = int(time.time())
+        metadata = EmbeddingsMetadata(
+            artifact_id=origin.artifact_id,
+            embedding_model=self.config.model_name,
+            created_at=now,
+            updated_at=now,
+            artifact_type=origin.artifact_type.name,
+            parent_id=origin.parent_id
+        )
+        return EmbeddingsResult(
+            id=artifact.artifact_id,
+            embedding=embedding,
+            content=text,
+            metadata=metadata
+        )
+
     async def _async_embed_chunk(self, chunk: Chunk) -> EmbeddingsResult:
         """
         Internal method to asynchronously embed a single chunk.
@@ -371,6 +481,17 @@ class EmbeddingsBase(Embeddings):
             EmbeddingsResult: Embedding result for the chunk.
         """
         embedding = await self.async_embed_query(chunk.content)
+        return self._chunk_embedding_result(chunk, embedding)
+
+    def _chunk_embedding_result(self, chunk: Chunk, embedding: List[float]) -> EmbeddingsResult:
+        """
+        Wrap the embedding of a chunk into an EmbeddingsResult.
+        Args:
+            chunk (Chunk): The embedded chunk.
+            embedding (List[float]): Embedding vector of the chunk content.
+        Returns:
+            EmbeddingsResult: Embedding result for the chunk.
+        """
         now = int(time.time())
         metadata = EmbeddingsMetadata(
             artifact_id=chunk.artifact_id,
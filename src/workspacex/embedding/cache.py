@@ -0,0 +1,87 @@
+import hashlib
+import os
+import sqlite3
+import threading
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# SQLite limits the number of bound parameters per statement
+_QUERY_BATCH_SIZE = 500
+# embeddings are stored as float32, half the size of Python floats and the precision vector stores keep anyway
+_EMBEDDING_TYPECODE = "f"
+
+
+class EmbeddingCache:
+    """
+    Persistent content-hash -> embedding cache backed by SQLite.
+
+    Entries are keyed by (model, sha256(text)) so unchanged chunks are not sent to the embedder again
+    when an artifact or the whole workspace is re-indexed. Safe to share between threads.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: SQLite database file, created if it doesn't exist
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings_f32 ("
+                "model TEXT NOT NULL, content_hash TEXT NOT NULL, embedding BLOB NOT NULL, "
+                "PRIMARY KEY (model, content_hash)) WITHOUT ROWID"
+            )
+
+    @staticmethod
+    def content_hash(text: str) -> str:
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def get(self, model: str, content_hash: str) -> Optional[List[float]]:
+        return self.get_many(model, [content_hash]).get(content_hash)
+
+    def get_many(self, model: str, content_hashes: Iterable[str]) -> Dict[str, List[float]]:
+        """
+        Args:
+            model: Embedding model key
+            content_hashes: Hashes to look up
+
+        Returns:
+            content_hash -> embedding for the hashes found in the cache
+        """
+        hashes = list(dict.fromkeys(content_hashes))
+        found: Dict[str, List[float]] = {}
+        with self._lock:
+            for i in range(0, len(hashes), _QUERY_BATCH_SIZE):
+                batch = hashes[i:i + _QUERY_BATCH_SIZE]
+                rows = self._conn.execute(
+                    f"SELECT content_hash, embedding FROM embeddings_f32 WHERE model = ? "
+                    f"AND content_hash IN ({','.join('?' * len(batch))})",
+                    [model, *batch]
+                ).fetchall()
+                for content_hash, blob in rows:
+                    found[content_hash] = array(_EMBEDDING_TYPECODE, blob).tolist()
+        return found
+
+    def put_many(self, model: str, items: Iterable[Tuple[str, List[float]]]) -> None:
+        """
+        Args:
+            model: Embedding model key
+            items: (content_hash, embedding) pairs
+        """
+        rows = [(model, content_hash, array(_EMBEDDING_TYPECODE, embedding).tobytes()) for content_hash, embedding in items]
+        if not rows:
+            return
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings_f32 (model, content_hash, embedding) VALUES (?, ?, ?)", rows
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
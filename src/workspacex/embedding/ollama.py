@@ -1,9 +1,10 @@
+import asyncio
 from typing import List
 
 import aiohttp
 import requests
 
-from workspacex.embedding.base import EmbeddingsConfig, EmbeddingsBase
+from workspacex.embedding.base import EmbeddingsConfig, EmbeddingsBase, ASYNC_EMBED_MAX_CONCURRENCY
 from workspacex.utils.logger import logger
 
 
@@ -66,6 +67,39 @@ class OllamaEmbeddings(EmbeddingsBase):
         except Exception as e:
             raise RuntimeError(f"Ollama async embedding API error: {e}")
       
+    async def async_embed_texts(self, texts: List[str]) -> List[List[float]]:
+        """
+        Asynchronously embed several texts, sending up to config.batch_size inputs per /api/embed request.
+        Args:
+            texts (List[str]): Texts to embed.
+        Returns:
+            List[List[float]]: Embedding vectors, in the order of texts.
+        """
+        url = self.config.base_url.rstrip('/') + "/api/embed"
+        batch_size = max(self.config.batch_size, 1)
+        batches = [texts[i:i + batch_size] for i in range(0, len(texts), batch_size)]
+        semaphore = asyncio.Semaphore(ASYNC_EMBED_MAX_CONCURRENCY)
+
+        async def _embed_batch(session: aiohttp.ClientSession, batch: List[str]) -> List[List[float]]:
+            payload = {
+                "model": self.config.model_name,
+                "input": batch
+            }
+            async with semaphore, session.post(url, json=payload) as resp:
+                resp.raise_for_status()
+                data = await resp.json()
+                return data.get("embeddings", [])
+
+        try:
+            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.config.timeout)) as session:
+                responses = await asyncio.gather(*[_embed_batch(session, batch) for batch in batches])
+        except Exception as e:
+            raise RuntimeError(f"Ollama async embedding API error: {e}")
+        embeddings = [embedding for batch_embeddings in responses for embedding in batch_embeddings]
+        if len(embeddings) != len(texts):
+            raise RuntimeError(f"Ollama async embedding API error: got {len(embeddings)} embeddings for {len(texts)} texts")
+        return embeddings
+
     @staticmethod
     def resolve_embedding(data: dict) -> List[float]:
         """
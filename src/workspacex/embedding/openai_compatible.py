@@ -1,9 +1,11 @@
+import asyncio
+
 from workspacex.utils.logger import logger
 from typing import Any, List
 
 from openai import OpenAI, AsyncOpenAI
 
-from workspacex.embedding.base import EmbeddingsConfig, EmbeddingsBase
+from workspacex.embedding.base import EmbeddingsConfig, EmbeddingsBase, ASYNC_EMBED_MAX_CONCURRENCY
 from workspacex.utils.timeit import timeit
 
 
@@ -76,6 +78,36 @@ class OpenAICompatibleEmbeddings(EmbeddingsBase):
             traceback.print_exc()
             raise RuntimeError(f"OpenAI async embedding API error: {e}")
 
+    async def async_embed_texts(self, texts: List[str]) -> List[List[float]]:
+        """
+        Asynchronously embed several texts, sending up to config.batch_size inputs per request.
+        Args:
+            texts (List[str]): Texts to embed.
+        Returns:
+            List[List[float]]: Embedding vectors, in the order of texts.
+        """
+        batch_size = max(self.config.batch_size, 1)
+        batches = [texts[i:i + batch_size] for i in range(0, len(texts), batch_size)]
+        semaphore = asyncio.Semaphore(ASYNC_EMBED_MAX_CONCURRENCY)
+
+        async def _embed_batch(batch: List[str]):
+            async with semaphore:
+                return await self.async_client.embeddings.create(
+                    model=self.config.model_name,
+                    input=batch,
+                    dimensions=self.config.dimensions)
+
+        try:
+            responses = await asyncio.gather(*[_embed_batch(batch) for batch in batches])
+        except Exception as e:
+            raise RuntimeError(f"OpenAI async embedding API error: {e}")
+        embeddings = []
+        for response in responses:
+            embeddings.extend(item.embedding for item in sorted(response.data, key=lambda item: item.index))
+        if len(embeddings) != len(texts):
+            raise RuntimeError(f"OpenAI async embedding API error: got {len(embeddings)} embeddings for {len(texts)} texts")
+        return embeddings
+
     @staticmethod
     def resolve_embedding(data: list[Any]) -> List[float]:
         """
@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Optional, List, Dict, Any
 
@@ -116,6 +117,17 @@ class FulltextDB(ABC):
         """
         pass
         
+    async def ainsert(self, index_name: str, documents: List[Dict[str, Any]]):
+        """Insert documents into the index without blocking the event loop.
+
+        Runs insert in a worker thread by default, implementations with an async client should override it.
+
+        Args:
+            index_name (str): Name of the index
+            documents (List[Dict[str, Any]]): List of documents to insert
+        """
+        return await asyncio.to_thread(self.insert, index_name, documents)
+
     @abstractmethod
     def upsert(self, index_name: str, documents: List[Dict[str, Any]]):
         """Update or insert documents in the index.
@@ -142,6 +154,48 @@ class FulltextDB(ABC):
         """
         pass
         
+    async def adelete(
+        self,
+        index_name: str,
+        ids: Optional[List[str]] = None,
+        filter: Optional[Dict[str, Any]] = None,
+    ):
+        """Delete documents from the index without blocking the event loop.
+
+        Runs delete in a worker thread by default, implementations with an async client should override it.
+
+        Args:
+            index_name (str): Name of the index
+            ids (Optional[List[str]]): List of document IDs to delete
+            filter (Optional[Dict[str, Any]]): Filter conditions for documents to delete
+        """
+        return await asyncio.to_thread(self.delete, index_name, ids=ids, filter=filter)
+
+    def replace(self, index_name: str, filter: Dict[str, Any], documents: List[Dict[str, Any]]):
+        """Replace the documents matching filter with the given documents.
+
+        The default deletes then inserts, implementations should override it to write the new documents
+        before dropping the stale ones so searches never see the matched documents disappear.
+
+        Args:
+            index_name (str): Name of the index
+            filter (Dict[str, Any]): Filter conditions for the documents being replaced
+            documents (List[Dict[str, Any]]): List of documents to store, may be empty
+        """
+        self.delete(index_name, filter=filter)
+        if documents:
+            self.insert(index_name, documents)
+
+    async def areplace(self, index_name: str, filter: Dict[str, Any], documents: List[Dict[str, Any]]):
+        """Replace the documents matching filter without blocking the event loop.
+
+        Args:
+            index_name (str): Name of the index
+            filter (Dict[str, Any]): Filter conditions for the documents being replaced
+            documents (List[Dict[str, Any]]): List of documents to store, may be empty
+        """
+        return await asyncio.to_thread(self.replace, index_name, filter, documents)
+
     @abstractmethod
     def reset(self):
         """Reset the database.
@@ -22,6 +22,8 @@ class ElasticsearchFulltextDB(FulltextDB):
                 - number_of_shards: Number of shards for indices
                 - number_of_replicas: Number of replicas for indices
                 - use_chinese_analyzer: Whether to use Chinese analyzer (ik_max_word/ik_smart)
+                - refresh: Refresh policy of bulk writes, "wait_for" (default), True or False
+                - bulk_chunk_size: Number of documents per bulk request
         """
         self.config = config
         self.hosts = config.get("hosts", ["http://localhost:9200"])
@@ -31,6 +33,11 @@ class ElasticsearchFulltextDB(FulltextDB):
         self.number_of_shards = config.get("number_of_shards", 1)
         self.number_of_replicas = config.get("number_of_replicas", 0)
         self.use_chinese_analyzer = config.get("use_chinese_analyzer", True)
+        # "wait_for" makes writes visible on the next scheduled refresh instead of forcing one per bulk call
+        self.refresh = config.get("refresh", "wait_for")
+        self.bulk_chunk_size = config.get("bulk_chunk_size", 500)
+        # indices known to exist, saves an exists round trip per write
+        self._known_indices: set[str] = set()
         
         # Initialize Elasticsearch client
         try:
@@ -96,6 +103,7 @@ class ElasticsearchFulltextDB(FulltextDB):
         """
         try:
             full_index_name = self._get_index_name(index_name)
+            self._known_indices.discard(full_index_name)
             if self.es.indices.exists(index=full_index_name):
                 self.es.indices.delete(index=full_index_name)
                 logger.info(f"Deleted index: {full_index_name}")
@@ -109,7 +117,9 @@ class ElasticsearchFulltextDB(FulltextDB):
             index_name (str): Name of the index
         """
         full_index_name = self._get_index_name(index_name)
-        
+        if full_index_name in self._known_indices:
+            return
+
         if not self.es.indices.exists(index=full_index_name):
             # Choose analyzer based on configuration
             if self.use_chinese_analyzer:
@@ -185,6 +195,7 @@ class ElasticsearchFulltextDB(FulltextDB):
             
             self.es.indices.create(index=full_index_name, body=mapping)
             logger.info(f"✅ Created index: {full_index_name}")
+        self._known_indices.add(full_index_name)
     
     def recreate_index(self, index_name: str):
         """Recreate index with current analyzer configuration.
@@ -199,6 +210,7 @@ class ElasticsearchFulltextDB(FulltextDB):
             full_index_name = self._get_index_name(index_name)
             
             # Delete existing index if it exists
+            self._known_indices.discard(full_index_name)
             if self.es.indices.exists(index=full_index_name):
                 self.es.indices.delete(index=full_index_name)
                 logger.info(f"🗑️ Deleted existing index: {full_index_name}")
@@ -397,20 +409,9 @@ class ElasticsearchFulltextDB(FulltextDB):
             self._create_index_if_not_exists(index_name)
             full_index_name = self._get_index_name(index_name)
             
-            # Prepare bulk actions
-            actions = []
-            for doc in documents:
-                action = {
-                    "_index": full_index_name,
-                    "_source": doc
-                }
-                if "id" in doc:
-                    action["_id"] = doc["id"]
-                actions.append(action)
-            
             # Execute bulk insert
-            if actions:
-                success, failed = bulk(self.es, actions, refresh=True)
+            if documents:
+                success, failed = self._bulk(full_index_name, documents)
                 logger.info(f"Inserted {success} documents into {full_index_name}")
                 if failed:
                     logger.warning(f"Failed to insert {len(failed)} documents")
@@ -418,6 +419,23 @@ class ElasticsearchFulltextDB(FulltextDB):
         except Exception as e:
             logger.error(f"Error inserting documents into {index_name}: {e}")
     
+    def _bulk(self, full_index_name: str, documents: List[Dict[str, Any]]):
+        """Index documents with the bulk API, actions are streamed to the helper instead of built up front.
+
+        Args:
+            full_index_name (str): Prefixed index name
+            documents (List[Dict[str, Any]]): Documents to index, their "id" is used as _id when present
+
+        Returns:
+            (number of indexed documents, errors)
+        """
+        actions = (
+            {"_index": full_index_name, "_id": doc["id"], "_source": doc} if "id" in doc
+            else {"_index": full_index_name, "_source": doc}
+            for doc in documents
+        )
+        return bulk(self.es, actions, chunk_size=self.bulk_chunk_size, refresh=self.refresh)
+
     def upsert(self, index_name: str, documents: List[Dict[str, Any]]):
         """Update or insert documents in the index.
         
@@ -429,20 +447,9 @@ class ElasticsearchFulltextDB(FulltextDB):
             self._create_index_if_not_exists(index_name)
             full_index_name = self._get_index_name(index_name)
             
-            # Prepare bulk actions
-            actions = []
-            for doc in documents:
-                action = {
-                    "_index": full_index_name,
-                    "_source": doc
-                }
-                if "id" in doc:
-                    action["_id"] = doc["id"]
-                actions.append(action)
-            
             # Execute bulk upsert
-            if actions:
-                success, failed = bulk(self.es, actions, refresh=True)
+            if documents:
+                success, failed = self._bulk(full_index_name, documents)
                 logger.info(f"Upserted {success} documents into {full_index_name}")
                 if failed:
                     logger.warning(f"Failed to upsert {len(failed)} documents")
@@ -500,11 +507,48 @@ class ElasticsearchFulltextDB(FulltextDB):
         except Exception as e:
             logger.error(f"Error deleting documents from {index_name}: {e}")
     
+    def replace(self, index_name: str, filter: Dict[str, Any], documents: List[Dict[str, Any]]):
+        """Replace the documents matching filter, indexing the new documents before deleting the stale ones.
+
+        Args:
+            index_name (str): Name of the index
+            filter (Dict[str, Any]): Filter conditions for the documents being replaced
+            documents (List[Dict[str, Any]]): List of documents to store, may be empty
+        """
+        if not documents or any("id" not in doc for doc in documents):
+            # documents without an id can't be told apart from the stale ones
+            super().replace(index_name, filter, documents)
+            return
+        try:
+            self._create_index_if_not_exists(index_name)
+            full_index_name = self._get_index_name(index_name)
+
+            success, failed = self._bulk(full_index_name, documents)
+            if failed:
+                logger.warning(f"Failed to index {len(failed)} documents, keeping the previous ones")
+                return
+
+            # drop documents matching the filter that weren't just written
+            query_body = {
+                "query": {
+                    "bool": {
+                        "filter": [{"term": {key: value}} for key, value in filter.items()],
+                        "must_not": [{"ids": {"values": [doc["id"] for doc in documents]}}]
+                    }
+                }
+            }
+            response = self.es.delete_by_query(index=full_index_name, body=query_body)
+            logger.info(f"Replaced documents in {full_index_name}: {success} indexed, {response['deleted']} stale deleted")
+
+        except Exception as e:
+            logger.error(f"Error replacing documents in {index_name}: {e}")
+
     def reset(self):
         """Reset the database.
         
         This will delete all indices and document entries.
         """
+        self._known_indices.clear()
         try:
             # Get all indices with the prefix
             indices = self.es.indices.get(index=f"{self.index_prefix}_*")
@@ -1,6 +1,6 @@
 from workspacex.utils.logger import logger
-import traceback
-from typing import Callable, List, Dict, Any, Optional, Union
+import asyncio
+from typing import Awaitable, Callable, List, Dict, Any, Optional, Union
 import inspect
 
 from workspacex.artifact import Artifact
@@ -70,38 +70,27 @@ class DecoratorBasedObserver(WorkspaceObserver):
     
     async def on_create(self, workspace_id: str, artifact: Artifact, **kwargs) -> List[Any]:
         """Process artifact creation with all handlers"""
-        results = []
-        for handler in self.create_handlers:
-            try:
-                result = await handler(workspace_id=workspace_id, artifact=artifact, **kwargs)
-                if result is not None:
-                    results.append(result)
-            except Exception as e:
-                print(f"Create handler failed:  error is {e}: {traceback.format_exc()}")
-        return results
+        return await self._run_handlers("Create", [
+            handler(workspace_id=workspace_id, artifact=artifact, **kwargs) for handler in self.create_handlers
+        ])
     
     async def on_update(self, artifact: Artifact, **kwargs) -> List[Any]:
         """Process artifact update with all handlers"""
-        results = []
-        for handler in self.update_handlers:
-            try:
-                result = await handler(artifact, **kwargs)
-                if result is not None:
-                    results.append(result)
-            except Exception as e:
-                print(f"Update handler failed: {e}")
-        return results
+        return await self._run_handlers("Update", [handler(artifact, **kwargs) for handler in self.update_handlers])
     
     async def on_delete(self, artifact: Artifact, **kwargs) -> List[Any]:
         """Process artifact deletion with all handlers"""
+        return await self._run_handlers("Delete", [handler(artifact, **kwargs) for handler in self.delete_handlers])
+
+    @staticmethod
+    async def _run_handlers(operation: str, calls: List[Awaitable[Any]]) -> List[Any]:
+        """Run handler calls concurrently, a failing handler is logged and doesn't affect the others"""
         results = []
-        for handler in self.delete_handlers:
-            try:
-                result = await handler(artifact, **kwargs)
-                if result is not None:
-                    results.append(result)
-            except Exception as e:
-                print(f"Delete handler failed: {e}")
+        for result in await asyncio.gather(*calls, return_exceptions=True):
+            if isinstance(result, Exception):
+                logger.error(f"{operation} handler failed: error is {result}", exc_info=result)
+            elif result is not None:
+                results.append(result)
         return results
     
     def register_create_handler(self, func, instance=None, workspace_id=None, filters=None):
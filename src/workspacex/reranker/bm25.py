@@ -1,3 +1,4 @@
+import heapq
 import math
 import re
 from collections import Counter
@@ -81,12 +82,11 @@ class BM25RerankRunner(BaseRerankRunner):
             if score_threshold is None or score >= score_threshold:
                 results.append(RerankResult(artifact=doc, score=score))
         
-        # Sort by score in descending order
-        results.sort(key=lambda x: x.score, reverse=True)
-        
-        # Apply top_n filter
+        # Sort by score in descending order, only keeping the top_n results
         if top_n is not None:
-            results = results[:top_n]
+            results = heapq.nlargest(top_n, results, key=lambda x: x.score)
+        else:
+            results.sort(key=lambda x: x.score, reverse=True)
         
         return results
 
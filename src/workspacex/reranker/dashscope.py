@@ -1,3 +1,4 @@
+import heapq
 from typing import List, Optional
 from workspacex.reranker.base import BaseRerankRunner, RerankConfig, RerankResult
 from workspacex.artifact import Artifact
@@ -98,8 +99,7 @@ class AliyunRerankRunner(BaseRerankRunner):
             artifact = documents[item['index']]
             results.append(RerankResult(artifact=artifact, score=score))
         if top_n is not None:
-            results = sorted(results, key=lambda x: x.score,
-                             reverse=True)[:top_n]
+            results = heapq.nlargest(top_n, results, key=lambda x: x.score)
         return results
 
     def _run_http(
@@ -138,6 +138,5 @@ class AliyunRerankRunner(BaseRerankRunner):
             artifact = documents[item['index']]
             results.append(RerankResult(artifact=artifact, score=score))
         if top_n is not None:
-            results = sorted(results, key=lambda x: x.score,
-                             reverse=True)[:top_n]
+            results = heapq.nlargest(top_n, results, key=lambda x: x.score)
         return results
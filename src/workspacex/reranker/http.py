@@ -1,3 +1,4 @@
+import heapq
 import json
 from typing import List, Optional
 
@@ -112,5 +113,5 @@ class HttpRerankRunner(BaseRerankRunner):
             results.append(RerankResult(artifact=artifact, score=score))
             
         if top_n is not None:
-            results = sorted(results, key=lambda x: x.score, reverse=True)[:top_n]
+            results = heapq.nlargest(top_n, results, key=lambda x: x.score)
         return results
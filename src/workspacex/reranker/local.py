@@ -1,3 +1,4 @@
+import heapq
 from typing import List, Optional, Dict, Any
 
 from workspacex.reranker.base import BaseRerankRunner, RerankConfig, RerankResult
@@ -173,10 +174,11 @@ class Qwen3RerankerRunner(BaseRerankRunner):
                 RerankResult(artifact=documents[idx], score=score))
 
         # Sort and filter results
-        rerank_results = sorted(rerank_results,
-                               key=lambda x: x.score,
-                               reverse=True)
         if top_n is not None:
-            rerank_results = rerank_results[:top_n]
+            rerank_results = heapq.nlargest(top_n, rerank_results, key=lambda x: x.score)
+        else:
+            rerank_results = sorted(rerank_results,
+                                   key=lambda x: x.score,
+                                   reverse=True)
 
         return rerank_results
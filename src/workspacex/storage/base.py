@@ -1,12 +1,71 @@
 import json
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from pydantic import BaseModel
 
 from workspacex.artifact import Chunk
 
+try:
+    # orjson parses large index files several times faster than the stdlib parser
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def loads_json(data: Union[str, bytes]) -> Any:
+    """
+    Parse a JSON document, using orjson when it is installed.
+    Args:
+        data: JSON text or UTF-8 bytes
+    Returns:
+        The parsed object
+    """
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_json(obj: Any) -> bytes:
+    """
+    Serialize plain JSON data (dicts, lists, str, numbers) to UTF-8 bytes, using orjson when it is installed.
+    Args:
+        obj: The object to serialize
+    Returns:
+        The JSON document as bytes
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _encode_default(obj: Any) -> Any:
+    """orjson ``default`` hook mirroring CommonEncoder for the types orjson does not handle natively."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def encode_json(obj: Any) -> bytes:
+    """
+    Serialize index and artifact metadata to UTF-8 bytes, using orjson when it is installed.
+    Pydantic models are dumped like CommonEncoder does; orjson writes enums by value and numpy arrays as lists.
+    Args:
+        obj: The object to serialize
+    Returns:
+        The JSON document as bytes
+    """
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(obj, default=_encode_default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+        except TypeError:
+            # e.g. integers beyond 64 bits, let the stdlib encoder handle them
+            pass
+    return json.dumps(obj, ensure_ascii=False, cls=CommonEncoder).encode("utf-8")
+
 
 class BaseRepository(ABC):
     """
@@ -22,6 +81,14 @@ class BaseRepository(ABC):
         """
         pass
     
+    def get_index_stat(self) -> Optional[Tuple[str, Any]]:
+        """
+        Get a cheap version token for the workspace index, used to validate cached workspace data.
+        Returns:
+            (index location, version) tuple, or None if the backend can't tell or the index doesn't exist
+        """
+        return None
+
     @abstractmethod
     def store_index(self, index_data: Dict[str, Any]) -> None:
         """
@@ -33,6 +100,30 @@ class BaseRepository(ABC):
         """
         pass
 
+    def append_artifact_ref(self, artifact_id: str, artifact_meta: Dict[str, Any],
+                            updated_at: Optional[str] = None) -> bool:
+        """
+        Record an added or updated artifact entry without rewriting the whole workspace index.
+        Args:
+            artifact_id: Artifact ID
+            artifact_meta: Index entry of the artifact ({"type": ..., "metadata": ...})
+            updated_at: New workspace updated_at, if it changed
+        Returns:
+            True if the entry was recorded, False if the backend can't patch the index and a full store_index is needed
+        """
+        return False
+
+    def remove_artifact_ref(self, artifact_id: str, updated_at: Optional[str] = None) -> bool:
+        """
+        Record a removed artifact entry without rewriting the whole workspace index.
+        Args:
+            artifact_id: Artifact ID
+            updated_at: New workspace updated_at, if it changed
+        Returns:
+            True if the removal was recorded, False if the backend can't patch the index and a full store_index is needed
+        """
+        return False
+
     @abstractmethod
     def store_artifact(self, artifact: Any, save_sub_list_content: bool = True) -> None:
         """
@@ -59,6 +150,19 @@ class BaseRepository(ABC):
         """
         pass
 
+    def get_chunk_windows(self, items: List[Tuple[str, str, int, int, int]]) -> List[Tuple[Optional[list[Chunk]], Optional[Chunk], Optional[list[Chunk]]]]:
+        """
+        Get several chunk windows in one call.
+
+        Backends that can fetch many objects per round trip should override this,
+        the default implementation simply calls get_chunk_window for each item.
+        Args:
+            items: list of (artifact_id, parent_id, chunk_index, pre_n, next_n)
+        Returns:
+            List of (pre_n_chunks, chunk, next_n_chunks), in the same order as items
+        """
+        return [self.get_chunk_window(*item) for item in items]
+
     @abstractmethod
     def get_chunks(self, artifact_id: str, parent_id: str) -> Optional[list[Chunk]]:
         """
@@ -98,6 +202,31 @@ class BaseRepository(ABC):
         """
         pass
 
+    def retrieve_artifacts(self, artifact_ids: List[str], max_workers: int = 16) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Retrieve the data of several artifacts at once.
+        The default implementation fans retrieve_artifact out over a thread pool,
+        backends that support batched reads should override it.
+        Args:
+            artifact_ids: The IDs of the artifacts to retrieve
+            max_workers: Max number of concurrent reads
+        Returns:
+            Mapping of artifact ID to artifact data (None if not found)
+        """
+        if not artifact_ids:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(artifact_ids))) as executor:
+            return dict(zip(artifact_ids, executor.map(self.retrieve_artifact, artifact_ids)))
+
+    def prefetch_artifacts(self, artifact_ids: List[str]) -> None:
+        """
+        Hint the backend that the given artifacts will be retrieved soon.
+        Default is a no-op, must never raise.
+        Args:
+            artifact_ids: The IDs of the artifacts about to be retrieved
+        """
+        return None
+
     @abstractmethod
     def get_subaritfact_content(self, artifact_id: str, parent_id: str) -> Optional[str]:
         """
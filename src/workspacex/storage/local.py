@@ -1,14 +1,18 @@
-import json
+import os
 import shutil
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 
 from tqdm import tqdm
 
 from workspacex.artifact import Artifact, ArtifactType, Chunk
 from workspacex.utils.logger import logger
-from .base import BaseRepository, CommonEncoder
+from .base import BaseRepository, encode_json, loads_json
+
+# chunk files of an artifact are read/written concurrently, small files are dominated by syscall latency
+CHUNK_IO_WORKERS = 16
 
 
 class LocalPathRepository(BaseRepository):
@@ -31,6 +35,10 @@ class LocalPathRepository(BaseRepository):
         self.index_path = self._full_path("index.json")
         self.versions_dir = self._full_path("versions")
         self.versions_dir.mkdir(parents=True, exist_ok=True)
+        # append-only log of artifact entries added/removed since index.json was last written
+        self.refs_path = self._full_path("artifact_refs.jsonl")
+        # (index version, top-level index entries other than "workspace") as of the last index write
+        self._index_extras: Optional[Tuple[Any, Dict[str, Any]]] = None
 
     def _full_path(self, relative_path: str) -> Path:
         """
@@ -44,12 +52,20 @@ class LocalPathRepository(BaseRepository):
         Args:
             index: Index dictionary
         """
+        payload = encode_json(index)
+        # write to a temp file first so a failed dump never leaves a torn index.json behind
+        tmp_path = self.index_path.with_name(f"{self.index_path.name}.tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
         if self.index_path.exists():
             version_name = f"index_his_{int(time.time())}.json"
             version_path = self.versions_dir / version_name
             self.index_path.replace(version_path)
-        with open(self.index_path, 'w', encoding='utf-8') as f:
-            json.dump(index, f, indent=2, ensure_ascii=False, cls=CommonEncoder)
+        tmp_path.replace(self.index_path)
+        # the full index already covers every logged artifact entry
+        self.refs_path.unlink(missing_ok=True)
+        self._index_extras = (self._index_file_version(),
+                              {key: value for key, value in index.items() if key != "workspace"})
 
     def _load_index(self) -> Dict[str, Any]:
         """
@@ -58,8 +74,7 @@ class LocalPathRepository(BaseRepository):
             Index dictionary
         """
         if self.index_path.exists():
-            with open(self.index_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return loads_json(self.index_path.read_bytes())
         else:
             index = {}
             self._save_index(index)
@@ -86,10 +101,27 @@ class LocalPathRepository(BaseRepository):
         """
         artifact_index_path = self._full_path(self._artifact_index_path(artifact_id))
         if artifact_index_path.exists():
-            with open(artifact_index_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return loads_json(artifact_index_path.read_bytes())
         return None
 
+    def prefetch_artifacts(self, artifact_ids: List[str]) -> None:
+        """
+        Ask the OS to read the artifact index files into the page cache ahead of retrieve_artifacts.
+        """
+        if not hasattr(os, "posix_fadvise"):
+            return
+        for artifact_id in artifact_ids:
+            try:
+                fd = os.open(self._full_path(self._artifact_index_path(artifact_id)), os.O_RDONLY)
+            except OSError:
+                continue
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            except OSError:
+                pass
+            finally:
+                os.close(fd)
+
     def store_index(self, index_data: dict) -> None:
         """
         Store the workspace information in index.json, versioning the previous index.
@@ -98,10 +130,105 @@ class LocalPathRepository(BaseRepository):
         Returns:
             None
         """
-        index = self._load_index()
+        # the index is only re-read when someone else wrote it since our last write
+        index_version = self._index_file_version()
+        if self._index_extras and index_version and self._index_extras[0] == index_version:
+            index = dict(self._index_extras[1])
+        else:
+            index = self._load_index()
         index["workspace"] = index_data
         self._save_index(index)
 
+    def append_artifact_ref(self, artifact_id: str, artifact_meta: Dict[str, Any],
+                            updated_at: Optional[str] = None) -> bool:
+        """
+        Append an added/updated artifact entry to artifact_refs.jsonl, index.json is left untouched.
+        Args:
+            artifact_id: Artifact ID
+            artifact_meta: Index entry of the artifact ({"type": ..., "metadata": ...})
+            updated_at: New workspace updated_at, if it changed
+        Returns:
+            False if there is no index.json to patch yet
+        """
+        if not self.index_path.exists():
+            return False
+        self._append_ref({"op": "put", "id": artifact_id, **artifact_meta}, updated_at)
+        return True
+
+    def remove_artifact_ref(self, artifact_id: str, updated_at: Optional[str] = None) -> bool:
+        """
+        Append a removed artifact entry to artifact_refs.jsonl, index.json is left untouched.
+        Args:
+            artifact_id: Artifact ID
+            updated_at: New workspace updated_at, if it changed
+        Returns:
+            False if there is no index.json to patch yet
+        """
+        if not self.index_path.exists():
+            return False
+        self._append_ref({"op": "remove", "id": artifact_id}, updated_at)
+        return True
+
+    def _append_ref(self, ref: Dict[str, Any], updated_at: Optional[str]) -> None:
+        if updated_at:
+            ref["updated_at"] = updated_at
+        with open(self.refs_path, "ab") as f:
+            f.write(encode_json(ref) + b"\n")
+
+    def _apply_artifact_refs(self, workspace: Dict[str, Any]) -> None:
+        """
+        Replay artifact_refs.jsonl over the artifact columns of the workspace index, in place.
+        Args:
+            workspace: The "workspace" entry of index.json
+        """
+        try:
+            lines = self.refs_path.read_bytes().splitlines()
+        except FileNotFoundError:
+            return
+        if "artifact_types" not in workspace:
+            # row-wise index written before the columnar layout
+            rows = workspace.pop("artifacts", [])
+            workspace["artifact_ids"] = [row.get("id") or row.get("artifact_id") for row in rows]
+            workspace["artifact_types"] = [row.get("type") for row in rows]
+            workspace["artifact_metadatas"] = [row.get("metadata") for row in rows]
+        artifact_ids = workspace.setdefault("artifact_ids", [])
+        artifact_types = workspace["artifact_types"]
+        artifact_metadatas = workspace.setdefault("artifact_metadatas", [])
+        positions = {artifact_id: i for i, artifact_id in enumerate(artifact_ids)}
+        removed = False
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                ref = loads_json(line)
+            except ValueError:
+                # torn tail of an interrupted append
+                logger.warning(f"⚠️ skip unreadable artifact ref in {self.refs_path}")
+                continue
+            artifact_id = ref.get("id")
+            if ref.get("updated_at"):
+                workspace["updated_at"] = ref["updated_at"]
+            if ref.get("op") == "remove":
+                i = positions.pop(artifact_id, None)
+                if i is not None:
+                    artifact_ids[i] = None
+                    removed = True
+                continue
+            i = positions.get(artifact_id)
+            if i is None:
+                positions[artifact_id] = len(artifact_ids)
+                artifact_ids.append(artifact_id)
+                artifact_types.append(ref.get("type"))
+                artifact_metadatas.append(ref.get("metadata"))
+            else:
+                artifact_types[i] = ref.get("type")
+                artifact_metadatas[i] = ref.get("metadata")
+        if removed:
+            kept = [i for i, artifact_id in enumerate(artifact_ids) if artifact_id is not None]
+            workspace["artifact_ids"] = [artifact_ids[i] for i in kept]
+            workspace["artifact_types"] = [artifact_types[i] for i in kept]
+            workspace["artifact_metadatas"] = [artifact_metadatas[i] for i in kept]
+
     def store_artifact(self, artifact: "Artifact", save_sub_list_content: bool = True, save_attachment_files: bool = True) -> None:
         """
         Store an artifact and its sub-artifacts in the file system.
@@ -119,8 +246,9 @@ class LocalPathRepository(BaseRepository):
         if save_attachment_files:
             self.save_attachment_files(artifact)
         index_path = self._full_path(self._artifact_index_path(artifact_id))
-        with open(index_path, "w", encoding="utf-8") as f:
-            json.dump(artifact_meta, f, indent=2, ensure_ascii=False, cls=CommonEncoder)
+        payload = encode_json(artifact_meta)
+        with open(index_path, "wb") as f:
+            f.write(payload)
             
     def save_attachment_files(self, artifact: "Artifact") -> None:
         """
@@ -139,12 +267,13 @@ class LocalPathRepository(BaseRepository):
 
     def save_sub_artifact_content(self, artifact, artifact_id, artifact_meta,save_sub_list_content ):
         sub_artifacts_meta = []
-        for sub in tqdm(artifact.sublist, desc="save_sub_artifact_content"):
+        # artifact_meta already holds the serialized sub-artifacts (Artifact.to_dict), reuse them
+        for sub, sub_meta in tqdm(zip(artifact.sublist, artifact_meta["sublist"]), total=len(artifact.sublist),
+                                  desc="save_sub_artifact_content"):
             sub_id = sub.artifact_id
             sub_type = sub.artifact_type
             sub_dir = self._full_path(self._sub_dir(artifact_id, sub_id))
             sub_dir.mkdir(parents=True, exist_ok=True)
-            sub_meta = sub.to_dict()
             # TODO add ext
             if save_sub_list_content:
                 if sub_type in [ArtifactType.NOVEL_CHAPTER, ArtifactType.TEXT]:
@@ -164,8 +293,31 @@ class LocalPathRepository(BaseRepository):
         """
         if not self.index_path.exists():
             return None
-        with open(self.index_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        index = loads_json(self.index_path.read_bytes())
+        if index.get("workspace") and self.refs_path.exists():
+            self._apply_artifact_refs(index["workspace"])
+        return index
+
+    def get_index_stat(self) -> Optional[Tuple[str, Any]]:
+        """
+        Version the local index by the mtime and size of index.json and of the artifact ref log.
+        """
+        index_version = self._index_file_version()
+        if index_version is None:
+            return None
+        try:
+            stat = self.refs_path.stat()
+            refs_version = (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            refs_version = None
+        return self.index_path.as_posix(), (*index_version, refs_version)
+
+    def _index_file_version(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = self.index_path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
 
     def get_subaritfact_content(self, artifact_id: str, parent_id: str) -> Optional[str]:
         """
@@ -237,20 +389,57 @@ class LocalPathRepository(BaseRepository):
                     next_n_chunks.append(next_n_chunk)
         return pre_n_chunks, chunk, next_n_chunks
 
+    def get_chunk_windows(self, items: List[Tuple[str, str, int, int, int]]) \
+            -> List[Tuple[Optional[list[Chunk]], Optional[Chunk], Optional[list[Chunk]]]]:
+        """
+        Get several chunk windows, chunk files shared by overlapping windows are read only once
+        """
+        if not items:
+            return []
+        paths = []
+        for artifact_id, parent_id, chunk_index, pre_n, next_n in items:
+            chunk_dir = self._full_path(self._chunk_dir(artifact_id, parent_id))
+            for index in range(max(chunk_index - pre_n, 0), chunk_index + next_n + 1):
+                paths.append(chunk_dir / f"{artifact_id}_chunk_{index}.json")
+        paths = list(dict.fromkeys(paths))
+
+        def _read(path: Path) -> Optional[Chunk]:
+            return self._read_chunk_file(path) if path.exists() else None
+
+        with ThreadPoolExecutor(max_workers=min(CHUNK_IO_WORKERS, len(paths))) as executor:
+            chunks = dict(zip(paths, executor.map(_read, paths)))
+
+        windows = []
+        for artifact_id, parent_id, chunk_index, pre_n, next_n in items:
+            chunk_dir = self._full_path(self._chunk_dir(artifact_id, parent_id))
+            chunk = chunks.get(chunk_dir / f"{artifact_id}_chunk_{chunk_index}.json")
+            if not chunk:
+                windows.append((None, None, None))
+                continue
+            pre_n_chunks = [c for c in (chunks.get(chunk_dir / chunk.pre_n_chunk_file_name(i + 1))
+                                        for i in range(min(pre_n, chunk_index))) if c]
+            next_n_chunks = [c for c in (chunks.get(chunk_dir / chunk.next_n_chunk_file_name(i + 1))
+                                         for i in range(next_n)) if c]
+            windows.append((pre_n_chunks, chunk, next_n_chunks))
+        return windows
+
     def get_chunks(self, artifact_id: str, parent_id: str) -> Optional[list[Chunk]]:
         chunk_dir = self._full_path(self._chunk_dir(artifact_id, parent_id))
         if not chunk_dir.exists():
             return None
-        chunks = []
-        for chunk_file in chunk_dir.glob("*.json"):
-            try:
-                with open(chunk_file, "r", encoding="utf-8") as f:
-                    chunk = Chunk.model_validate_json(f.read())	
-                    chunks.append(chunk)
-            except Exception as e:
-                logger.error(f"🔍 get_chunks error: {e}")
-                continue
-        return chunks
+        chunk_files = list(chunk_dir.glob("*.json"))
+        if not chunk_files:
+            return []
+        with ThreadPoolExecutor(max_workers=min(CHUNK_IO_WORKERS, len(chunk_files))) as executor:
+            return [chunk for chunk in executor.map(self._read_chunk_file, chunk_files) if chunk is not None]
+
+    @staticmethod
+    def _read_chunk_file(chunk_file: Path) -> Optional[Chunk]:
+        try:
+            return Chunk.model_validate_json(chunk_file.read_bytes())
+        except Exception as e:
+            logger.error(f"🔍 get_chunks error: {e}")
+            return None
 
     def store_artifact_chunks(self, artifact: "Artifact", chunks: list["Chunk"]) -> None:
         """
@@ -260,10 +449,16 @@ class LocalPathRepository(BaseRepository):
         if chunk_dir.exists():
             shutil.rmtree(chunk_dir)
         chunk_dir.mkdir(parents=True, exist_ok=True)
-        for chunk in tqdm(chunks, desc="store_artifact_chunks"):
-            file_path = chunk_dir / chunk.chunk_file_name
-            with open(file_path, "w", encoding="utf-8") as f:
+        if not chunks:
+            return
+
+        def _write_chunk(chunk: Chunk) -> None:
+            with open(chunk_dir / chunk.chunk_file_name, "w", encoding="utf-8") as f:
                 f.write(chunk.model_dump_json(indent=2))
+
+        with ThreadPoolExecutor(max_workers=min(CHUNK_IO_WORKERS, len(chunks))) as executor:
+            for _ in tqdm(executor.map(_write_chunk, chunks), total=len(chunks), desc="store_artifact_chunks"):
+                pass
         
     def get_attachment_file(self, artifact_id: str, file_name: str) -> Optional[bytes]:
         """
@@ -1,9 +1,8 @@
 import asyncio
-import json
 import mimetypes
 import os
 import time
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 
 import s3fs
 from tqdm import tqdm
@@ -11,7 +10,7 @@ from tqdm import tqdm
 from workspacex.artifact import Artifact, ArtifactType, Chunk
 from workspacex.utils.logger import logger
 from workspacex.utils.timeit import timeit
-from .base import BaseRepository, CommonEncoder
+from .base import BaseRepository, encode_json, loads_json
 
 
 class S3Repository(BaseRepository):
@@ -60,20 +59,20 @@ class S3Repository(BaseRepository):
     @timeit(logger.info,
             "S3Repository._save_index took {elapsed_time:.3f} seconds")
     def _save_index(self, index: Dict[str, Any]) -> None:
+        payload = encode_json(index)
         if self.fs.exists(self.index_path):
             version_name = f"index_his_{int(time.time())}.json"
             version_path = f"{self.versions_dir}/{version_name}"
             self.fs.move(self.index_path, version_path)
         content_type = self.guess_content_type(self.index_path)
-        with self.fs.open(self.index_path, 'w', ContentType=content_type) as f:
-            json.dump(index, f, indent=2, ensure_ascii=False, cls=CommonEncoder)
+        with self.fs.open(self.index_path, 'wb', ContentType=content_type) as f:
+            f.write(payload)
 
     @timeit(logger.info,
             "S3Repository._load_index took {elapsed_time:.3f} seconds")
     def _load_index(self) -> Dict[str, Any]:
         if self.fs.exists(self.index_path):
-            with self.fs.open(self.index_path, 'r') as f:
-                return json.load(f)
+            return loads_json(self.fs.cat(self.index_path))
         else:
             logger.info(f"🔍 _load_index index_path not found: {self.index_path}")
             index = {}
@@ -86,10 +85,24 @@ class S3Repository(BaseRepository):
     def retrieve_artifact(self, artifact_id: str) -> Optional[Dict[str, Any]]:
         index_path = self._full_path(self._artifact_index_path(artifact_id))
         if self.fs.exists(index_path):
-            with self.fs.open(index_path, 'r') as f:
-                return json.load(f)
+            return loads_json(self.fs.cat(index_path))
         return None
 
+    @timeit(logger.info,
+            "S3Repository.retrieve_artifacts took {elapsed_time:.3f} seconds")
+    def retrieve_artifacts(self, artifact_ids: List[str], max_workers: int = 16) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Retrieve several artifact index files with a single batched s3fs fetch
+        """
+        if not artifact_ids:
+            return {}
+        paths = {artifact_id: self._full_path(self._artifact_index_path(artifact_id)) for artifact_id in artifact_ids}
+        contents = self.fs.cat(list(paths.values()), on_error="omit")
+        return {
+            artifact_id: loads_json(contents[path]) if path in contents else None
+            for artifact_id, path in paths.items()
+        }
+
     @timeit(logger.info,
             "S3Repository.store_index took {elapsed_time:.3f} seconds")
     def store_index(self, index_data: dict) -> None:
@@ -114,14 +127,10 @@ class S3Repository(BaseRepository):
         if save_attachment_files:
             self.save_attachment_files(artifact)
         index_path = self._full_path(self._artifact_index_path(artifact_id))
-        from workspacex.storage.local import CommonEncoder
         content_type = self.guess_content_type(index_path)
-        with self.fs.open(index_path, "w", ContentType=content_type) as f:
-            json.dump(artifact_meta,
-                      f,
-                      indent=2,
-                      ensure_ascii=False,
-                      cls=CommonEncoder)
+        payload = encode_json(artifact_meta)
+        with self.fs.open(index_path, "wb", ContentType=content_type) as f:
+            f.write(payload)
         logger.info(f"📦 Storing artifact {artifact_id} with {len(artifact.sublist)} sub-artifacts finished")
             
     def save_attachment_files(self, artifact: "Artifact") -> None:
@@ -145,13 +154,14 @@ class S3Repository(BaseRepository):
         logger.info(f"Artifact {artifact.artifact_id} saved {len(artifact.attachment_files)} attachment files")
 
     def save_sub_artifact_content(self, artifact, artifact_id, artifact_meta, sub_artifacts_meta, save_sub_list_content):
-        for sub in tqdm(artifact.sublist, desc="Uploading sub-artifacts"):
+        # artifact_meta already holds the serialized sub-artifacts (Artifact.to_dict), reuse them
+        for sub, sub_meta in tqdm(zip(artifact.sublist, artifact_meta["sublist"]), total=len(artifact.sublist),
+                                  desc="Uploading sub-artifacts"):
             sub_id = sub.artifact_id
             sub_type = sub.artifact_type
             sub_dir = self._full_path(self._sub_dir(artifact_id, sub_id))
             if not self.fs.exists(sub_dir):
                 self.fs.mkdirs(sub_dir, exist_ok=True)
-            sub_meta = sub.to_dict()
             if save_sub_list_content:
                 if sub_type in [ArtifactType.NOVEL_CHAPTER, ArtifactType.TEXT]:
                     content = sub.content
@@ -174,9 +184,18 @@ class S3Repository(BaseRepository):
         """
         if not self.fs.exists(self.index_path):
             return None
-        with self.fs.open(self.index_path, "r") as f:
-            return json.load(f)
+        return loads_json(self.fs.cat(self.index_path))
         
+    def get_index_stat(self) -> Optional[Tuple[str, Any]]:
+        """
+        Version the S3 index by its ETag (single HEAD request).
+        """
+        try:
+            info = self.fs.info(self.index_path, refresh=True)
+        except FileNotFoundError:
+            return None
+        return self.index_path, info.get("ETag") or (info.get("LastModified"), info.get("size"))
+
     def get_subaritfact_content(self, artifact_id: str, parent_id: str) -> Optional[str]:
         """
         Retrieve the content of a sub-artifact by artifact ID and parent ID.
@@ -228,6 +247,39 @@ class S3Repository(BaseRepository):
                         next_n_chunks.append(next_n_chunk)
         return pre_n_chunks, chunk, next_n_chunks
 
+    def get_chunk_windows(self, items: List[Tuple[str, str, int, int, int]]) \
+            -> List[Tuple[Optional[list[Chunk]], Optional[Chunk], Optional[list[Chunk]]]]:
+        """
+        Get several chunk windows with a single batched fetch of all chunk files
+        """
+        if not items:
+            return []
+        paths = []
+        for artifact_id, parent_id, chunk_index, pre_n, next_n in items:
+            chunk_dir = self._full_path(self._chunk_dir(artifact_id, parent_id))
+            for index in range(max(chunk_index - pre_n, 0), chunk_index + next_n + 1):
+                paths.append(f"{chunk_dir}/{artifact_id}_chunk_{index}.json")
+        logger.info(f"🔍 get_chunk_windows fetch {len(paths)} chunk files for {len(items)} windows")
+        contents = self.fs.cat(list(dict.fromkeys(paths)), on_error="omit")
+
+        def _load(chunk_dir: str, artifact_id: str, index: int) -> Optional[Chunk]:
+            content = contents.get(f"{chunk_dir}/{artifact_id}_chunk_{index}.json")
+            return Chunk.model_validate_json(content) if content else None
+
+        windows = []
+        for artifact_id, parent_id, chunk_index, pre_n, next_n in items:
+            chunk_dir = self._full_path(self._chunk_dir(artifact_id, parent_id))
+            chunk = _load(chunk_dir, artifact_id, chunk_index)
+            if not chunk:
+                windows.append((None, None, None))
+                continue
+            pre_n_chunks = [c for c in (_load(chunk_dir, artifact_id, chunk_index - i - 1)
+                                        for i in range(min(pre_n, chunk_index))) if c]
+            next_n_chunks = [c for c in (_load(chunk_dir, artifact_id, chunk_index + i + 1)
+                                         for i in range(next_n)) if c]
+            windows.append((pre_n_chunks, chunk, next_n_chunks))
+        return windows
+
     def get_chunks(self, artifact_id: str, parent_id: str) -> Optional[list[Chunk]]:
         chunk_dir = self._full_path(self._chunk_dir(artifact_id, parent_id))
         if not self.fs.exists(chunk_dir):
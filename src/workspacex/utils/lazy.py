@@ -0,0 +1,68 @@
+import threading
+from typing import Any, Callable, List
+
+
+class LazyList(list):
+    """
+    List whose items are produced by a loader on first access.
+
+    The loader runs once, the first time the items are read or the list is mutated,
+    also when the first accesses race from several threads. The items are stored in the
+    list itself, so once loaded it behaves exactly like a plain list; code reading the list
+    storage directly (C extensions, serializers) must call load() first.
+    """
+
+    def __init__(self, loader: Callable[[], List[Any]]):
+        """
+        Args:
+            loader: Callable returning the list items
+        """
+        super().__init__()
+        self._loader = loader
+        self._load_lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._loader is None
+
+    def load(self) -> "LazyList":
+        """Run the loader if it didn't run yet, returns the list itself"""
+        if self._loader is not None:
+            with self._load_lock:
+                if self._loader is not None:
+                    list.extend(self, self._loader())
+                    self._loader = None
+        return self
+
+    def __repr__(self) -> str:
+        if self._loader is not None:
+            return f"{type(self).__name__}(<not loaded>)"
+        return list.__repr__(self)
+
+    def __radd__(self, other):
+        # list.__add__ would read the storage of an unloaded list directly
+        return list(other) + list.copy(self.load())
+
+    def __reduce_ex__(self, protocol):
+        # copies and pickles are plain lists, the loader and its lock aren't copyable
+        return list, (list(self.load()),)
+
+
+def _loading(name: str) -> Callable:
+    method = getattr(list, name)
+
+    def wrapper(self, *args, **kwargs):
+        self.load()
+        return method(self, *args, **kwargs)
+
+    wrapper.__name__ = name
+    wrapper.__qualname__ = f"LazyList.{name}"
+    wrapper.__doc__ = method.__doc__
+    return wrapper
+
+
+for _name in ("__len__", "__iter__", "__reversed__", "__contains__", "__getitem__", "__setitem__",
+              "__delitem__", "__eq__", "__ne__", "__lt__", "__le__", "__gt__", "__ge__", "__add__",
+              "__iadd__", "__mul__", "__rmul__", "__imul__", "append", "extend", "insert", "remove",
+              "pop", "clear", "index", "count", "sort", "reverse", "copy"):
+    setattr(LazyList, _name, _loading(_name))
@@ -23,6 +23,14 @@ class LangFuseHolder:
 
 LANGFUSE_HOLDER = LangFuseHolder()
 
+
+def _format_prompt_log(model_name: str, messages: list[dict]) -> str:
+    """Debug log line of a prompt, built in one join (prompts can be large)"""
+    lines = [f"📝 LLM[{model_name}] request prompt:\n"]
+    for idx, msg in enumerate(messages):
+        lines.append(f"  [{idx}] ({msg.get('role', 'unknown')}): {msg.get('content', '')}\n")
+    return "".join(lines)
+
 def call_llm(prompt: str, model_name: str = None,
              llm_config: dict[str, Any] = {}, enable_trace: bool = False) -> str:
 
@@ -71,12 +79,8 @@ async def call_llm_async(prompt: str,
             messages.append({"role": "system", "content": system_prompt})
         messages.append({"role": "user", "content": prompt})
 
-        log_msg = f"📝 LLM[{llm_model.model_name}] request prompt:\n"
-        for idx, msg in enumerate(messages):
-            role = msg.get("role", "unknown")
-            content = msg.get("content", "")
-            log_msg += f"  [{idx}] ({role}): {content}\n"
-        logging.debug(log_msg)
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug(_format_prompt_log(llm_model.model_name, messages))
         if enable_trace:
             response = await llm_model.ainvoke(
                 messages,
@@ -111,12 +115,8 @@ async def call_llm_messages_async(model_name: str,
         start_time = time.time()
         llm_model = get_llm_model(model_name, llm_config)
 
-        log_msg = f"📝 LLM[{llm_model.model_name}] request prompt:\n"
-        for idx, msg in enumerate(messages):
-            role = msg.get("role", "unknown")
-            content = msg.get("content", "")
-            log_msg += f"  [{idx}] ({role}): {content}\n"
-        logging.debug(log_msg)
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug(_format_prompt_log(llm_model.model_name, messages))
         if enable_trace:
             response = await llm_model.ainvoke(
                 messages,
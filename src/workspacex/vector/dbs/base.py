@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Optional, List
 
@@ -41,7 +42,7 @@ class VectorDB(ABC):
         Args:
             collection_name (str): Name of the collection
             vectors (list[list[float | int]]): Query vectors
-            filter (dict): Filter conditions
+            filter (dict): Filter conditions, a list value matches any of its items
             threshold (float): Threshold for similarity search
             limit (int): Maximum number of results to return
             
@@ -88,6 +89,17 @@ class VectorDB(ABC):
         """
         pass
         
+    async def ainsert(self, collection_name: str, items: list[EmbeddingsResult]):
+        """Insert items into the collection without blocking the event loop.
+
+        Runs insert in a worker thread by default, implementations with an async client should override it.
+
+        Args:
+            collection_name (str): Name of the collection
+            items (list[EmbeddingsResult]): List of embedding results to insert
+        """
+        return await asyncio.to_thread(self.insert, collection_name, items)
+
     @abstractmethod
     def upsert(self, collection_name: str, items: list[EmbeddingsResult]):
         """Update or insert items in the collection.
@@ -114,6 +126,48 @@ class VectorDB(ABC):
         """
         pass
         
+    async def adelete(
+        self,
+        collection_name: str,
+        ids: Optional[list[str]] = None,
+        filter: Optional[dict] = None,
+    ):
+        """Delete items from the collection without blocking the event loop.
+
+        Runs delete in a worker thread by default, implementations with an async client should override it.
+
+        Args:
+            collection_name (str): Name of the collection
+            ids (Optional[list[str]]): List of item IDs to delete
+            filter (Optional[dict]): Filter conditions for items to delete
+        """
+        return await asyncio.to_thread(self.delete, collection_name, ids=ids, filter=filter)
+
+    def replace(self, collection_name: str, filter: dict, items: list[EmbeddingsResult]):
+        """Replace the items matching filter with the given items.
+
+        The default deletes then inserts, implementations should override it to write the new items
+        before dropping the stale ones so searches never see the matched items disappear.
+
+        Args:
+            collection_name (str): Name of the collection
+            filter (dict): Filter conditions for the items being replaced, a list value matches any of its items
+            items (list[EmbeddingsResult]): List of embedding results to store, may be empty
+        """
+        self.delete(collection_name, filter=filter)
+        if items:
+            self.insert(collection_name, items)
+
+    async def areplace(self, collection_name: str, filter: dict, items: list[EmbeddingsResult]):
+        """Replace the items matching filter without blocking the event loop.
+
+        Args:
+            collection_name (str): Name of the collection
+            filter (dict): Filter conditions for the items being replaced
+            items (list[EmbeddingsResult]): List of embedding results to store, may be empty
+        """
+        return await asyncio.to_thread(self.replace, collection_name, filter, items)
+
     @abstractmethod
     def reset(self):
         """Reset the database.
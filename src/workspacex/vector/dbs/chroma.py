@@ -3,6 +3,7 @@ import traceback
 from typing import Optional
 
 import chromadb
+import numpy as np
 from chromadb import Settings
 from chromadb.utils.batch_utils import create_batches
 from tqdm import tqdm
@@ -80,26 +81,16 @@ class ChromaVectorDB(VectorDB):
         try:
             collection = self.client.get_collection(name=collection_name)
             if collection:
-                # Convert simple key-value filters to ChromaDB operator format
-                where_conditions = []
-                if filter:
-                    for key, value in filter.items():
-                        where_conditions.append({key: {"$eq": value}})
-                    where_filter = {"$and": where_conditions} if len(where_conditions) > 1 else where_conditions[0]
-                else:
-                    where_filter = None
-
                 result = collection.query(
                     query_embeddings=vectors,
-                    where=where_filter,
+                    where=self._where_filter(filter) if filter else None,
                     n_results=limit,
                 )
 
                 # chromadb has cosine distance, 2 (worst) -> 0 (best). Re-ordering to 0 -> 1
                 # https://docs.trychroma.com/docs/collections/configure cosine equation
-                distances: list = result["distances"][0]
-                distances = [2 - dist for dist in distances]
-                distances = [[dist / 2 for dist in distances]]
+                distances = (2 - np.asarray(result["distances"][0], dtype=np.float64)) / 2
+                distances = [distances.tolist()]
 
                 docs = self._convert2_embedding_result_with_score(result= result, distances=distances, threshold=threshold)
 
@@ -190,17 +181,17 @@ class ChromaVectorDB(VectorDB):
         metadatas = result.get("metadatas", [[]])[0]
         ids = result.get("ids", [[]])[0]
         
-        for document, metadata, id, score in zip(
-            documents,
-            metadatas,
-            ids,
-            scores
-        ):
+        # Drop hits under the threshold in one pass before validating any metadata
+        if threshold and distances:
+            keep = np.flatnonzero(np.asarray(scores, dtype=np.float64) >= threshold).tolist()
+        else:
+            keep = range(len(documents))
+
+        for i in keep:
+            document, metadata, id, score = documents[i], metadatas[i], ids[i], scores[i]
             # Metadata is already a dict since we stored it that way
             metadata_obj = EmbeddingsMetadata.model_validate(metadata)
-            if threshold and score < threshold:
-                continue
-            
+
             docs.append(
                 EmbeddingsResult(
                     id=id,
@@ -311,14 +302,7 @@ class ChromaVectorDB(VectorDB):
                 if ids:
                     collection.delete(ids=ids)
                 elif filter:
-                    where_conditions = []
-                    if filter:
-                        for key, value in filter.items():
-                            where_conditions.append({key: {"$eq": value}})
-                        where_filter = {"$and": where_conditions} if len(where_conditions) > 1 else where_conditions[0]
-                    else:
-                        where_filter = None
-                    collection.delete(where=where_filter)
+                    collection.delete(where=self._where_filter(filter))
                 else:
                     self.client.delete_collection(name=collection_name)
         except Exception as e:
@@ -328,6 +312,42 @@ class ChromaVectorDB(VectorDB):
             )
             pass
 
+    def replace(self, collection_name: str, filter: dict, items: list[EmbeddingsResult]):
+        """Replace the items matching filter, upserting the new items before deleting the stale ones.
+
+        Args:
+            collection_name (str): Name of the collection
+            filter (dict): Filter conditions for the items being replaced
+            items (list[EmbeddingsResult]): List of embedding results to store, may be empty
+        """
+        collection = self.client.get_or_create_collection(
+            name=collection_name, metadata={"hnsw:space": "cosine"}
+        )
+        where_filter = self._where_filter(filter)
+        existing_ids = set(collection.get(where=where_filter, include=[])["ids"])
+
+        new_ids = {item.id for item in items}
+        if items:
+            for batch in create_batches(
+                api=self.client,
+                ids=[item.id for item in items],
+                embeddings=[item.embedding for item in items],
+                metadatas=[item.metadata.model_dump() for item in items],
+                documents=[item.content for item in items],
+            ):
+                collection.upsert(*batch)
+
+        stale_ids = list(existing_ids - new_ids)
+        if stale_ids:
+            collection.delete(ids=stale_ids)
+
+    @staticmethod
+    def _where_filter(filter: dict) -> dict:
+        # Convert simple key-value filters to ChromaDB operator format, a list value matches any of its items
+        where_conditions = [{key: {"$in": value} if isinstance(value, list) else {"$eq": value}}
+                            for key, value in filter.items()]
+        return {"$and": where_conditions} if len(where_conditions) > 1 else where_conditions[0]
+
     def reset(self):
         # Resets the database. This will delete all collections and item entries.
         return self.client.reset()
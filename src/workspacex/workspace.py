@@ -1,13 +1,21 @@
 import asyncio
+import heapq
+import itertools
+import json
+import logging
 import os
 import threading
-import traceback
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from collections import OrderedDict, deque
 from datetime import datetime
-from typing import Dict, Any, Optional, List, Union
+from functools import partial
+from typing import Dict, Any, Optional, List, Set, Tuple, Union
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, field_serializer
 from tqdm import tqdm
+from tqdm.asyncio import tqdm_asyncio
 
 
 from workspacex.artifact import ArtifactType, Artifact, Chunk, ChunkSearchQuery, ChunkSearchResult, HybridSearchResult, \
@@ -16,20 +24,48 @@ from workspacex.artifacts.arxiv import ArxivArtifact
 from workspacex.base import WorkspaceConfig
 from workspacex.chunk.base import ChunkerFactory
 from workspacex.code_artifact import CodeArtifact
-from workspacex.embedding.base import EmbeddingFactory
-from workspacex.fulltext.dbs.base import FulltextDB, FulltextSearchResult
+from workspacex.embedding.base import EmbeddingFactory, EmbeddingsResults
+from workspacex.fulltext.dbs.base import FulltextDB, FulltextSearchResult, FulltextSearchResults
 from workspacex.fulltext.factory import FulltextDBFactory
 from workspacex.artifacts.novel_artifact import NovelArtifact
 from workspacex.observer import WorkspaceObserver, get_observer
 from workspacex.reranker.base import RerankResult
 from workspacex.reranker.factory import RerankerFactory
-from workspacex.storage.base import BaseRepository
+from workspacex.storage.base import BaseRepository, dumps_json, encode_json, loads_json
 from workspacex.storage.local import LocalPathRepository
+from workspacex.utils.cache import TTLCache
+from workspacex.utils.lazy import LazyList
 from workspacex.utils.logger import logger
 from workspacex.vector.dbs.base import VectorDB
 from workspacex.vector.factory import VectorDBFactory
 from workspacex.chunk.base import ChunkMetadata
 
+# max number of query embeddings kept in memory per workspace
+QUERY_EMBEDDING_CACHE_SIZE = 1024
+# max number of sub-artifact contents kept in memory per workspace
+CONTENT_CACHE_SIZE = 2048
+# vector/fulltext search responses are cached briefly, the cache is dropped whenever the indexes change
+SEARCH_CACHE_SIZE = 512
+SEARCH_CACHE_TTL = 30
+# rerank results of a (query, candidate set) are kept longer, the cache is dropped whenever an artifact is written
+RERANK_CACHE_SIZE = 2048
+RERANK_CACHE_TTL = 600
+# max threads used to fetch artifacts from the repository when loading a workspace
+LOAD_ARTIFACT_WORKERS = 16
+# artifact entries patched into the index log before the next add/delete rewrites the full index
+ARTIFACT_REF_COMPACT_THRESHOLD = 1000
+
+# index location -> (index version, encoded index data), shared by the workspaces of this process. Artifact data
+# isn't cached, artifact writes don't change the index version; the ttl bounds staleness on version collisions
+WORKSPACE_INDEX_CACHE_TTL = 300
+_WORKSPACE_INDEX_CACHE = TTLCache(maxsize=64, ttl=WORKSPACE_INDEX_CACHE_TTL)
+# one background thread warms the repository for workspace loads, at most once per index version
+_PREFETCH_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="workspace-prefetch")
+# index location -> index version whose artifacts were last submitted for prefetching
+_PREFETCHED_INDEXES = TTLCache(maxsize=64, ttl=WORKSPACE_INDEX_CACHE_TTL)
+# makes the check and record of _PREFETCHED_INDEXES one step for loads racing from several threads
+_PREFETCH_LOCK = threading.Lock()
+
 
 class WorkSpace(BaseModel):
     """
@@ -49,11 +85,16 @@ class WorkSpace(BaseModel):
     repository: Optional[BaseRepository] = Field(default=None, description="local artifact repository", exclude=True)
     workspace_config: Optional[WorkspaceConfig] = Field(default=None, description="workspace config", exclude=True)
     
-    vector_db: Optional[VectorDB] = Field(default=None, description="vector_db instance", exclude=True)
-    fulltext_db: Optional[FulltextDB] = Field(default=None, description="fulltext_db instance", exclude=True)
     kv_db: Optional[dict[str, Any]] = Field(default_factory=dict, description="kv_db instance", exclude=True)
 
-    model_config = ConfigDict(arbitrary_types_allowed=True, extra='allow')
+    # hot fields (updated_at, artifacts) are reassigned/mutated on every write, keep assignments unvalidated
+    model_config = ConfigDict(arbitrary_types_allowed=True, extra='allow',
+                              validate_assignment=False, revalidate_instances='never')
+
+    @field_serializer("artifacts")
+    def _serialize_artifacts(self, artifacts: List[Artifact]) -> List[Artifact]:
+        # pydantic reads the list storage directly, load lazily retrieved artifacts first
+        return artifacts.load() if isinstance(artifacts, LazyList) else artifacts
     
     def __init__(
             self,
@@ -66,7 +107,13 @@ class WorkSpace(BaseModel):
             repository: Optional[BaseRepository] = None,
             **kwargs
     ):
-        super().__init__()
+        # fill the field defaults like model_construct does instead of validating them in super().__init__(),
+        # every field is reassigned below
+        object.__setattr__(self, "__dict__", {name: field.get_default(call_default_factory=True)
+                                              for name, field in type(self).model_fields.items()})
+        object.__setattr__(self, "__pydantic_fields_set__", set())
+        object.__setattr__(self, "__pydantic_extra__", {})
+        object.__setattr__(self, "__pydantic_private__", None)
         self.workspace_id = workspace_id or str(uuid.uuid4())
         self.name = name or f"Workspace-{self.workspace_id[:8]}"
         self.created_at = datetime.now().isoformat()
@@ -84,6 +131,19 @@ class WorkSpace(BaseModel):
             self.repository = LocalPathRepository(storage_dir, clear_existing=clear_existing)
 
         # Initialize artifacts and metadata
+        self._index_location: Optional[str] = None
+        # bumped whenever artifacts are stored or the index is saved, keys the generate_tree_data cache
+        self._tree_version = 0
+        self._tree_cache: Optional[Tuple[int, Dict[str, Any]]] = None
+        self._tree_bytes_cache: Optional[Tuple[int, bytes]] = None
+        # artifact_id -> (type, metadata) from the workspace index, readable without loading the artifacts
+        self._artifact_metas: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        # artifact_id -> changed artifact (None if deleted) not yet patched into _artifact_metas
+        self._dirty_artifact_metas: Dict[str, Optional[Artifact]] = {}
+        # True once _artifact_metas holds the metadata dicts of the loaded artifacts rather than the index copies
+        self._artifact_metas_live = False
+        # pending prefetch of the artifacts of the loaded index, cancelled once they are retrieved
+        self._prefetch_future: Optional[Future] = None
         if clear_existing:
             self.artifacts = []
             self.metadata = {}
@@ -92,6 +152,7 @@ class WorkSpace(BaseModel):
             workspace_data = self._load_workspace_data()
             if workspace_data:
                 self.artifacts = workspace_data.get('artifacts', [])
+                self._artifact_metas = workspace_data.get('artifact_metas', {})
                 self.metadata = workspace_data.get('metadata', {})
                 self.created_at = workspace_data.get('created_at', self.created_at)
                 self.updated_at = workspace_data.get('updated_at', self.updated_at)
@@ -99,36 +160,58 @@ class WorkSpace(BaseModel):
                 self.artifacts = []
                 self.metadata = {}
 
+        # artifact_id -> artifact (top-level and sub-artifacts) for O(1) lookups,
+        # built on the first lookup miss so loading a workspace doesn't materialize its artifacts
+        self._artifact_index: Dict[str, Artifact] = {}
+        # (parent_id, sub_artifact_id) -> sub-artifact
+        self._sub_artifact_index: Dict[Tuple[str, str], Artifact] = {}
+        # artifact_type -> ids of the indexed artifacts and sub-artifacts of that type
+        self._type_index: Dict[ArtifactType, Set[str]] = {}
+        # artifact_id -> sublist length when it was indexed, None until the indexes are first built
+        self._indexed_sublist_sizes: Optional[Dict[str, int]] = None
+        # artifact_id -> (owner artifact or None for top-level, position in its list), rebuilt lazily when stale
+        self._artifact_positions: Dict[str, Tuple[Optional[Artifact], int]] = {}
+
         # Initialize observers
         self.observers: List[WorkspaceObserver] = []
+        # id() of the registered observers, O(1) duplicate checks
+        self._observer_ids: Set[int] = set()
         if use_default_observer:
-            self.observers.append(get_observer())
+            self.add_observer(get_observer())
 
         if observers:
             for observer in observers:
-                if observer not in self.observers:  # Avoid duplicates
-                    self.add_observer(observer)
+                self.add_observer(observer)
 
 
         
-        # Initialize full-text search database if enabled
-        if self.workspace_config.fulltext_db_config and self.workspace_config.fulltext_db_config.provider:
-            self.fulltext_db = FulltextDBFactory.get_fulltext_db(self.workspace_config.fulltext_db_config)
-        else:
-            self.fulltext_db = None
-            
-        # Initialize vector database if enabled
-        if self.workspace_config.vector_db_config and self.workspace_config.vector_db_config.provider:
-            self.vector_db = VectorDBFactory.get_vector_db(self.workspace_config.vector_db_config)
-        else:
-            self.vector_db = None
-        
+        # vector and full-text databases are created on first use, listing or reading artifacts never opens them
+        self._vector_db: Optional[VectorDB] = None
+        self._fulltext_db: Optional[FulltextDB] = None
+        self._vector_db_loaded = False
+        self._fulltext_db_loaded = False
+        self._db_lock = threading.Lock()
         self._reranker = None
         self._chunker = None
         self._embedder = None
+        # (embedding model, query) -> query embedding, LRU bounded by QUERY_EMBEDDING_CACHE_SIZE
+        self._query_embedding_cache: OrderedDict[Tuple[str, str], List[float]] = OrderedDict()
+        self._search_cache = TTLCache(maxsize=SEARCH_CACHE_SIZE, ttl=SEARCH_CACHE_TTL)
+        # (normalized query, candidate artifact ids, top_k) -> rerank results
+        self._rerank_cache = TTLCache(maxsize=RERANK_CACHE_SIZE, ttl=RERANK_CACHE_TTL)
+        # (parent_id, artifact_id) -> sub-artifact content, LRU bounded by CONTENT_CACHE_SIZE, read from worker threads
+        self._content_cache: OrderedDict[Tuple[str, str], str] = OrderedDict()
+        self._content_cache_lock = threading.Lock()
         
         # Initialize lock for thread-safe operations
         self._save_lock = asyncio.Lock()
+        # save() calls are numbered, a save only writes if no later-started save already covered it
+        self._save_requests = 0
+        self._saved_request = 0
+        # > 0 inside batch_save(), saves are deferred until the outermost block exits
+        self._defer_save_depth = 0
+        # artifact entries recorded with append/remove_artifact_ref since the last full save
+        self._pending_refs = 0
         
         if clear_existing:
             if self.vector_db:
@@ -148,6 +231,40 @@ class WorkSpace(BaseModel):
             self._embedder = EmbeddingFactory.get_embedder(self.workspace_config.embedding_config)
         return self._embedder
 
+    @property
+    def vector_db(self) -> Optional[VectorDB]:
+        """Vector database, None if not configured"""
+        if not self._vector_db_loaded:
+            with self._db_lock:
+                if not self._vector_db_loaded:
+                    vector_db_config = self.workspace_config.vector_db_config
+                    if vector_db_config and vector_db_config.provider:
+                        self._vector_db = VectorDBFactory.get_vector_db(vector_db_config)
+                    self._vector_db_loaded = True
+        return self._vector_db
+
+    @vector_db.setter
+    def vector_db(self, vector_db: Optional[VectorDB]) -> None:
+        self._vector_db = vector_db
+        self._vector_db_loaded = True
+
+    @property
+    def fulltext_db(self) -> Optional[FulltextDB]:
+        """Full-text database, None if not configured"""
+        if not self._fulltext_db_loaded:
+            with self._db_lock:
+                if not self._fulltext_db_loaded:
+                    fulltext_db_config = self.workspace_config.fulltext_db_config
+                    if fulltext_db_config and fulltext_db_config.provider:
+                        self._fulltext_db = FulltextDBFactory.get_fulltext_db(fulltext_db_config)
+                    self._fulltext_db_loaded = True
+        return self._fulltext_db
+
+    @fulltext_db.setter
+    def fulltext_db(self, fulltext_db: Optional[FulltextDB]) -> None:
+        self._fulltext_db = fulltext_db
+        self._fulltext_db_loaded = True
+
     @property
     def reranker(self):
         if not self._reranker:
@@ -316,8 +433,8 @@ class WorkSpace(BaseModel):
             return [artifact]
         
         if artifacts:
+            await self.add_artifacts(artifacts)
             for artifact in artifacts:
-                await self.add_artifact(artifact)
                 # Create async task for post-processing
                 await self.process_artifact(artifact)
             
@@ -351,7 +468,8 @@ class WorkSpace(BaseModel):
                 )   
                 
             except Exception as e:
-                logger.error(f"📦[POST-PROCESSING]❌ process_artifact[{artifact.artifact_type}]:{artifact.artifact_id} failed: {e}, traceback is {traceback.format_exc()}")
+                logger.exception("📦[POST-PROCESSING]❌ process_artifact[%s]:%s failed: %s",
+                                 artifact.artifact_type, artifact.artifact_id, e)
                 
                 # Mark artifact as error state
                 if hasattr(artifact, 'status'):
@@ -363,9 +481,9 @@ class WorkSpace(BaseModel):
                         await self._store_artifact(artifact)
                         logger.info(f"📦[POST-PROCESSING]✅ Saved error state for artifact: {artifact.artifact_id}")
                     except Exception as save_error:
-                        logger.error(f"📦[POST-PROCESSING]❌ Failed to save error state: {save_error}, traceback is {traceback.format_exc()}")
+                        logger.exception("📦[POST-PROCESSING]❌ Failed to save error state: %s", save_error)
 
-        logger.debug(f"📦[POST-PROCESSING]🔄 process_artifact[{artifact.artifact_type}]:{artifact.artifact_id} creating async task")
+        logger.debug("📦[POST-PROCESSING]🔄 process_artifact[%s]:%s creating async task", artifact.artifact_type, artifact.artifact_id)
         # Create async task for processing and updating
         asyncio.create_task(_process_artifact())
         logger.info(f"📦[POST-PROCESSING]✅ process_artifact[{artifact.artifact_type}]:{artifact.artifact_id} async task created")
@@ -393,18 +511,36 @@ class WorkSpace(BaseModel):
             else:
                 # Add to workspace
                 self.artifacts.append(artifact)
+                self._index_artifact(artifact)
 
                 await self._notify_observers("create", artifact)
+            if self._get_top_level_position(artifact.artifact_id) is not None:
+                self._dirty_artifact_metas[artifact.artifact_id] = artifact
 
             # Store in repository
             await self._store_artifact(artifact)
 
             # Update workspace time
             self.updated_at = datetime.now().isoformat()
-        
+            ref_saved = await self._save_artifact_ref(artifact.artifact_id, artifact)
+
         # 锁释放后，再调用 save() 避免死锁
-        await self.save()
+        if not ref_saved:
+            await self.save()
 
+    async def add_artifacts(self, artifacts: List[Artifact]) -> None:
+        """
+        Add several artifacts, the workspace index is written once for the whole batch
+
+        Args:
+            artifacts: Artifacts to create or update, in order
+
+        Returns:
+            None
+        """
+        async with self.batch_save():
+            for artifact in artifacts:
+                await self.add_artifact(artifact)
 
     async def _update_artifact(self, artifact: Artifact) -> None:
         """
@@ -416,11 +552,13 @@ class WorkSpace(BaseModel):
         Returns:
             None
         """
-        for i, a in enumerate(self.artifacts):
-            if a.artifact_id == artifact.artifact_id:
-                self.artifacts[i] = artifact
-                logger.info(f"[📂WORKSPACEX]🔄 Updating artifact in repository: {artifact.artifact_id}")
-                break
+        i = self._get_top_level_position(artifact.artifact_id)
+        if i is not None:
+            a = self.artifacts[i]
+            self.artifacts[i] = artifact
+            self._unindex_artifact(a)
+            self._index_artifact(artifact)
+            logger.info(f"[📂WORKSPACEX]🔄 Updating artifact in repository: {artifact.artifact_id}")
 
     async def update_artifact(
             self,
@@ -442,13 +580,17 @@ class WorkSpace(BaseModel):
         async with self._save_lock:
             artifact = self._get_artifact(artifact_id)
             if artifact:
+                # Unchanged immutable content, skip storing, re-embedding and notifying
+                if isinstance(content, (str, bytes)) and artifact.content == content:
+                    logger.debug("💼 update_artifact %s content unchanged, skipped", artifact_id)
+                    return artifact
                 artifact.update_content(content, description)
 
                 # Update storage
                 await self._store_artifact(artifact)
 
-                # Update workspace time
-                self.updated_at = datetime.now().isoformat()
+                # Update workspace time, same timestamp as the recorded version
+                self.updated_at = artifact.updated_at
 
                 # Notify observers
                 await self._notify_observers("update", artifact)
@@ -464,18 +606,28 @@ class WorkSpace(BaseModel):
             if artifact.parent_id:
                 parent_artifact = self._get_artifact(artifact.parent_id)
                 if parent_artifact:
-                    for sub_artifact in parent_artifact.sublist:
-                        if sub_artifact.artifact_id == artifact.artifact_id:
-                            sub_artifact.update_metadata(metadata)
-                            self.repository.store_artifact(parent_artifact, save_sub_list_content=False)
-                            return True
+                    sub_artifact = self._get_sub_artifact(artifact.parent_id, artifact.artifact_id)
+                    if sub_artifact:
+                        sub_artifact.update_metadata(metadata)
+                        await self._store_artifact_data(parent_artifact, save_sub_list_content=False)
+                        return True
             else:
                 artifact.update_metadata(metadata)
-                self.repository.store_artifact(artifact, save_sub_list_content=False)
+                await self._store_artifact_data(artifact, save_sub_list_content=False)
+                if artifact.artifact_id in self._artifact_metas:
+                    self._dirty_artifact_metas[artifact.artifact_id] = artifact
             return True
 
     async def save_artifact(self, artifact: Artifact, save_sub_list_content=False):
-        self.repository.store_artifact(artifact, save_sub_list_content=save_sub_list_content)
+        await self._store_artifact_data(artifact, save_sub_list_content=save_sub_list_content)
+
+    async def _store_artifact_data(self, artifact: Artifact, **kwargs) -> None:
+        """Write artifact data to the repository and drop the now stale cached workspace data"""
+        # the write runs in a worker thread, the caches are only touched from the event loop
+        await asyncio.to_thread(self.repository.store_artifact, artifact, **kwargs)
+        self._invalidate_content_cache(artifact.artifact_id)
+        self._rerank_cache.clear()
+        self._tree_version += 1
 
     async def delete_artifact(self, artifact_id: str) -> bool:
         """
@@ -488,25 +640,30 @@ class WorkSpace(BaseModel):
             Whether deletion was successful
         """
         async with self._save_lock:
-            for i, artifact in enumerate(self.artifacts):
-                if artifact.artifact_id == artifact_id:
-                    # Mark as archived
-                    artifact.archive()
-                    # Store the archived state
-                    await self._store_artifact(artifact)
-                    # Remove from list
-                    self.artifacts.pop(i)
-
-                    # Update workspace time
-                    self.updated_at = datetime.now().isoformat()
-            
-            # 锁释放后，再调用 save() 避免死锁
+            i = self._get_top_level_position(artifact_id)
+            if i is None:
+                return False
+            artifact = self.artifacts[i]
+            # Mark as archived
+            artifact.archive()
+            # Store the archived state
+            await self._store_artifact(artifact)
+            # Remove from list
+            self.artifacts.pop(i)
+            self._unindex_artifact(artifact)
+            self._dirty_artifact_metas[artifact_id] = None
+
+            # Update workspace time, same timestamp as the archived version
+            self.updated_at = artifact.updated_at
+            ref_saved = await self._save_artifact_ref(artifact_id)
+
+        # 锁释放后，再调用 save() 避免死锁
+        if not ref_saved:
             await self.save()
 
-            # Notify observers
-            await self._notify_observers("delete", artifact)
-            return True
-        return False
+        # Notify observers
+        await self._notify_observers("delete", artifact)
+        return True
     
     async def _store_artifact(self, artifact: Artifact) -> None:
         """Store artifact in repository"""
@@ -515,50 +672,135 @@ class WorkSpace(BaseModel):
             max_concurrent = getattr(self.workspace_config, 'max_concurrent_embeddings', 10)
             semaphore = asyncio.Semaphore(max_concurrent)
 
-            # Process main artifact and subartifacts in parallel for maximum concurrency
-            tasks = [self._store_artifact_chunk_and_embedding_with_semaphore(artifact, semaphore)]
-
-            if artifact.sublist and len(artifact.sublist) > 0:
-                # Add subartifacts to parallel processing
-                sub_tasks = [self._store_artifact_chunk_and_embedding_with_semaphore(subartifact, semaphore)
-                             for subartifact in artifact.sublist]
-                tasks.extend(sub_tasks)
+            # Chunk main artifact and subartifacts in parallel
+            artifacts = [artifact, *(artifact.sublist or [])]
+            if len(artifacts) > 1:
                 logger.info(
-                    f"🚀 Processing {len(tasks)} artifacts in parallel (1 main + {len(sub_tasks)} subartifacts) with max {max_concurrent} concurrent operations")
+                    f"🚀 Processing {len(artifacts)} artifacts in parallel (1 main + {len(artifacts) - 1} subartifacts) with max {max_concurrent} concurrent operations")
+
+            # Pipeline: indexing of an artifact starts as soon as its chunking finishes, chunks of
+            # chunkable artifacts are grouped into embedding batches of about embedding_config.batch_size
+            embedding_enabled = self.workspace_config.embedding_config.enabled
+            batch_size = self.workspace_config.embedding_config.batch_size
+            errors = []
+            index_tasks = []
+            batch: List[Tuple[Artifact, list[Chunk]]] = []
+            batch_chunks = 0
+            # artifacts embedded as a whole, their texts are embedded together once chunking is done
+            unchunked: List[Artifact] = []
+
+            async def _chunk(a: Artifact) -> Tuple[Artifact, Any]:
+                try:
+                    return a, await self._chunk_for_index_with_semaphore(a, semaphore)
+                except Exception as e:
+                    return a, e
+
+            async def _rebuild_embedding_with_semaphore(a: Artifact) -> None:
+                async with semaphore:
+                    await self._rebuild_artifact_embedding(a)
+
+            for chunked in asyncio.as_completed([_chunk(a) for a in artifacts]):
+                a, chunks = await chunked
+                if isinstance(chunks, Exception):
+                    errors.append(chunks)
+                    continue
+                if chunks is None:
+                    continue
+                index_tasks.append(asyncio.ensure_future(self._rebuild_artifact_fulltext(a, chunks)))
+                if not embedding_enabled:
+                    continue
+                if chunks and a.get_metadata_value("chunkable"):
+                    batch.append((a, chunks))
+                    batch_chunks += len(chunks)
+                    if batch_chunks >= batch_size:
+                        index_tasks.append(asyncio.ensure_future(self._embed_chunks_batch(batch)))
+                        batch, batch_chunks = [], 0
+                elif not a.get_metadata_value("chunkable"):
+                    unchunked.append(a)
+                else:
+                    # chunkable but not chunked now, its stored chunks are embedded
+                    index_tasks.append(asyncio.ensure_future(_rebuild_embedding_with_semaphore(a)))
+            if batch:
+                index_tasks.append(asyncio.ensure_future(self._embed_chunks_batch(batch)))
+            if unchunked:
+                index_tasks.append(asyncio.ensure_future(self._embed_artifacts_batch(unchunked)))
 
-            # Execute all embedding tasks in parallel with error handling
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            results = await asyncio.gather(*index_tasks, return_exceptions=True)
+            errors += [r for r in results if isinstance(r, Exception)]
 
             # Log any errors that occurred during parallel processing
-            errors = [r for r in results if isinstance(r, Exception)]
             if errors:
                 logger.error(f"❌ {len(errors)} errors occurred during parallel :")
                 for error in errors:
                     logger.error(f"[Workspace]- {type(error).__name__}: {error}")
             else:
-                logger.info(f"✅ All {len(tasks)} artifacts processed successfully in parallel")
+                logger.info(f"✅ All {len(artifacts)} artifacts processed successfully in parallel")
         finally:
             # save artifact
-            self.repository.store_artifact(artifact=artifact)
+            await self._store_artifact_data(artifact)
             logger.info(f"📦[CONTENT] store_artifact[{artifact.artifact_type}]:{artifact.artifact_id} content finished")
 
-    async def _store_artifact_chunk_and_embedding_with_semaphore(self, artifact: Artifact, semaphore: asyncio.Semaphore) -> None:
-        """Store artifact embedding with concurrency control"""
+    async def _chunk_for_index_with_semaphore(self, artifact: Artifact, semaphore: asyncio.Semaphore) -> Optional[list[Chunk]]:
+        """Chunk artifact for indexing with concurrency control"""
         async with semaphore:
-            return await self._chunk_and_embedding(artifact)
+            return await self._chunk_for_index(artifact)
+
+    async def _chunk_for_index(self, artifact: Artifact) -> Optional[list[Chunk]]:
+        """
+        Chunk an artifact before indexing it
+
+        Returns:
+            The chunks, [] if the artifact isn't chunked, None if chunking produced nothing to index
+        """
+        if self.workspace_config.chunk_config.enabled and artifact.support_chunking:
+            return await self._chunk_artifact(artifact) or None
+        return []
 
     async def _chunk_and_embedding(self, artifact: Artifact) -> None:
         """Store artifact embedding"""
 
         # if chunking is enabled, chunk the artifact first
-        chunks = []
-        if self.workspace_config.chunk_config.enabled and artifact.support_chunking:
-            chunks = await self._chunk_artifact(artifact)
-            if not chunks:
-                return
+        chunks = await self._chunk_for_index(artifact)
+        if chunks is None:
+            return
         index_tasks = [self._rebuild_artifact_embedding(artifact, chunks), self._rebuild_artifact_fulltext(artifact, chunks)]
         await asyncio.gather(*index_tasks)
 
+    async def _embed_chunks_batch(self, items: List[Tuple[Artifact, list[Chunk]]]) -> None:
+        """Replace the embeddings of the given artifacts, embedding all of their chunks in one embedder call"""
+        all_chunks = list(itertools.chain.from_iterable(chunks for _, chunks in items))
+        embedding_results = await self.embedder.async_embed_chunks(all_chunks)
+        replacements = []
+        offset = 0
+        for artifact, chunks in items:
+            replacements.append((artifact.artifact_id, embedding_results[offset:offset + len(chunks)]))
+            offset += len(chunks)
+        await self._replace_embeddings(replacements)
+        self._search_cache.clear()
+        logger.info(
+            f"📦[EMBEDDING-CHUNKING]✅ store_artifacts embedding_result finished, {len(items)} artifacts, {len(all_chunks)} chunks")
+
+    async def _embed_artifacts_batch(self, artifacts: List[Artifact]) -> None:
+        """Replace the embeddings of unchunked artifacts, embedding all of their texts in one embedder call"""
+        embeddable = []
+        for artifact in artifacts:
+            if artifact.get_embedding_text():
+                embeddable.append(artifact)
+            else:
+                logger.info(
+                    f"📦[EMBEDDING]❌ store_artifact[{artifact.artifact_type}]:{artifact.artifact_id} embedding is not enabled or embedding_text is empty")
+        try:
+            embedding_results = await self.embedder.async_embed_artifacts(embeddable)
+        except Exception as e:
+            logger.error(f"📦[EMBEDDING]❌ store_artifacts(unchunkable) {len(embeddable)} artifacts failed: {e}")
+            raise
+        results = dict(zip((artifact.artifact_id for artifact in embeddable), embedding_results))
+        # old embeddings are only deleted once the new ones are ready, artifacts without text just lose theirs
+        await self._replace_embeddings([(artifact.artifact_id, [results[artifact.artifact_id]] if artifact.artifact_id in results else [])
+                                        for artifact in artifacts])
+        self._search_cache.clear()
+        logger.info(f"📦[EMBEDDING]✅ store_artifacts(unchunkable) embedding_result finished, {len(embeddable)} artifacts")
+
     async def _chunk_artifact(self, artifact: Artifact) -> Optional[list[Chunk]]:
         """Chunk artifact"""
         chunker = self.get_chunker_by_artifact(artifact)
@@ -576,7 +818,7 @@ class WorkSpace(BaseModel):
                     logger.info(f"📦[CHUNKING] store_artifact[{artifact.artifact_type}]:{artifact.artifact_id} chunks is empty")
                     return []
             except Exception as e:
-                logger.error(f"📦[CHUNKING] store_artifact[{artifact.artifact_type}]:{artifact.artifact_id} failed: {e}\n traceback is {traceback.format_exc()}")
+                logger.exception("📦[CHUNKING] store_artifact[%s]:%s failed: %s", artifact.artifact_type, artifact.artifact_id, e)
                 raise
         else:
             return []
@@ -587,12 +829,89 @@ class WorkSpace(BaseModel):
         return self.chunker
 
     async def rebuild_index(self):
-        await self.rebuild_fulltext()
-        await self.rebuild_embedding()
+        """
+        Rebuild the fulltext documents and embeddings of all artifacts, loading each artifact's chunks once for both
+        """
+        if not self.fulltext_db:
+            logger.warning("📦[FULLTEXT]⚠️ fulltext_db is not enabled")
+            await self.rebuild_embedding()
+            return
+
+        use_chunk = self.workspace_config.fulltext_db_config.config.get('use_chunk', True)
+
+        async def _rebuild_artifact_index(artifact: Artifact, parent: Optional[Artifact], chunks: Optional[list[Chunk]]) -> None:
+            if parent is not None and not artifact.content:
+                artifact.content = await asyncio.to_thread(
+                    self._get_file_content_by_artifact_id, artifact_id=artifact.artifact_id, parent_id=parent.artifact_id)
+            await asyncio.gather(
+                self._rebuild_artifact_fulltext(artifact, chunks if use_chunk else None),
+                self._rebuild_artifact_embedding(artifact, chunks)
+            )
+
+        await self._rebuild_with_chunks(_rebuild_artifact_index, desc="workspace_rebuild_index")
 
     async def rebuild_embedding(self):
-        for artifact in tqdm(self.artifacts, desc="workspace_rebuild_embedding"):
-            await self.rebuild_artifact_embedding(artifact)
+        """
+        Rebuild the embeddings of all artifacts and their sub-artifacts
+        """
+        async def _rebuild_artifact_embedding(artifact: Artifact, parent: Optional[Artifact], chunks: Optional[list[Chunk]]) -> None:
+            await self._rebuild_artifact_embedding(artifact, chunks)
+
+        await self._rebuild_with_chunks(_rebuild_artifact_embedding, desc="workspace_rebuild_embedding")
+
+    async def _rebuild_with_chunks(self, handler, desc: str) -> None:
+        """
+        Run handler(artifact, parent, chunks) for all artifacts and their sub-artifacts
+
+        A producer loads the chunks of each artifact into a bounded queue while
+        max_concurrent_embeddings workers run the handler, so chunk loading,
+        embedding requests and index writes overlap.
+
+        Args:
+            handler: Coroutine function, parent is None for top-level artifacts and chunks None when not chunkable
+            desc: Progress bar description
+        """
+        workers = getattr(self.workspace_config, 'max_concurrent_embeddings', 10)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=2 * workers)
+        artifacts = [(a, parent) for artifact in self.artifacts
+                     for a, parent in ((artifact, None), *((sub, artifact) for sub in artifact.sublist or []))]
+        progress = tqdm(total=len(artifacts), desc=desc)
+        errors = []
+
+        async def _produce() -> None:
+            try:
+                for artifact, parent in artifacts:
+                    chunks = None
+                    if artifact.get_metadata_value("chunkable"):
+                        try:
+                            chunks = await self._load_artifact_chunks(artifact)
+                        except Exception as e:
+                            errors.append(e)
+                            logger.error(f"📦[REBUILD]❌ load_chunks[{artifact.artifact_type}]:{artifact.artifact_id} failed: {e}")
+                            progress.update(1)
+                            continue
+                    await queue.put((artifact, parent, chunks))
+            finally:
+                for _ in range(workers):
+                    await queue.put(None)
+
+        async def _consume() -> None:
+            while (item := await queue.get()) is not None:
+                artifact, parent, chunks = item
+                try:
+                    await handler(artifact, parent, chunks)
+                except Exception as e:
+                    errors.append(e)
+                    logger.error(f"📦[REBUILD]❌ {desc}[{artifact.artifact_type}]:{artifact.artifact_id} failed: {e}")
+                finally:
+                    progress.update(1)
+
+        try:
+            await asyncio.gather(_produce(), *[_consume() for _ in range(workers)])
+        finally:
+            progress.close()
+        if errors:
+            raise errors[0]
 
     async def rebuild_artifact_index(self, artifact: Artifact):
        logger.info(f"📦[REBUILD_ARTIFACT_INDEX]✅ start rebuild_artifact_index ->[{artifact.artifact_type}]:{artifact.artifact_id}")
@@ -606,45 +925,73 @@ class WorkSpace(BaseModel):
 
        logger.info(f"📦[REBUILD_ARTIFACT_INDEX]✅ rebuild_artifact_index finished -> [{artifact.artifact_type}]:{artifact.artifact_id} ")
 
-    async def rebuild_artifact_embedding(self, artifact: Artifact):
-        await self._rebuild_artifact_embedding(artifact)
-        for sub_artifact in tqdm(artifact.sublist, f"artifact_rebuild_embedding_sublist#{artifact.artifact_id}"):
-            await self._rebuild_artifact_embedding(sub_artifact)
+    async def rebuild_artifact_embedding(self, artifact: Artifact, chunks: list[Chunk] = None):
+        await self._rebuild_artifact_embedding(artifact, chunks)
+        if not artifact.sublist:
+            return
+
+        max_concurrent = getattr(self.workspace_config, 'max_concurrent_embeddings', 10)
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def _rebuild_with_semaphore(sub_artifact: Artifact) -> None:
+            async with semaphore:
+                await self._rebuild_artifact_embedding(sub_artifact)
+
+        await tqdm_asyncio.gather(*[_rebuild_with_semaphore(sub_artifact) for sub_artifact in artifact.sublist],
+                                  desc=f"artifact_rebuild_embedding_sublist#{artifact.artifact_id}")
 
     async def _rebuild_artifact_embedding(self, artifact: Artifact, chunks: list[Chunk] = None):
         if not self.workspace_config.embedding_config.enabled:
             return
 
-        self.vector_db.delete(self.default_vector_collection, filter={"artifact_id": artifact.artifact_id})
-        logger.info(f"📦[EMBEDDING]✅ delete_embeddings[{artifact.artifact_type}]:{artifact.artifact_id} finished")
-
+        embedding_results = []
         chunkable = artifact.get_metadata_value("chunkable")
         if chunkable:
             if not chunks:
                 chunks = await self._load_artifact_chunks(artifact)
             if chunks:
                 embedding_results = await self.embedder.async_embed_chunks(chunks)
-                await asyncio.to_thread(self.vector_db.insert, self.default_vector_collection, embedding_results)
-                logger.info(
-                    f"📦[EMBEDDING-CHUNKING]✅ store_artifact[{artifact.artifact_type}]:{artifact.artifact_id} embedding_result finished")
-        else:
+        elif not artifact.get_embedding_text():
             # if embedding is not enabled, skip
-            if not artifact.get_embedding_text():
-                logger.info(
-                    f"📦[EMBEDDING]❌ store_artifact[{artifact.artifact_type}]:{artifact.artifact_id} embedding is not enabled or embedding_text is empty")
-                return
+            logger.info(
+                f"📦[EMBEDDING]❌ store_artifact[{artifact.artifact_type}]:{artifact.artifact_id} embedding is not enabled or embedding_text is empty")
+        else:
             try:
-                embedding_result = await asyncio.to_thread(self.embedder.embed_artifact, artifact)
-                await asyncio.to_thread(self.vector_db.insert, self.default_vector_collection, [embedding_result])
-                logger.info(
-                    f"📦[EMBEDDING]✅ store_artifact(unchunkable)[{artifact.artifact_type}]:{artifact.artifact_id} embedding_result finished")
+                embedding_results = [await asyncio.to_thread(self.embedder.embed_artifact, artifact)]
             except Exception as e:
                 logger.error(
                     f"📦[EMBEDDING]❌ store_artifact(unchunkable)[{artifact.artifact_type}]:{artifact.artifact_id} failed: {e}")
                 raise
 
+        # old embeddings are only deleted once the new ones are ready
+        await self._replace_embeddings([(artifact.artifact_id, embedding_results)])
+        self._search_cache.clear()
+        if embedding_results:
+            logger.info(
+                f"📦[EMBEDDING]✅ store_artifact[{artifact.artifact_type}]:{artifact.artifact_id} embedding_result finished, {len(embedding_results)} embeddings")
+        else:
+            logger.info(f"📦[EMBEDDING]✅ delete_embeddings[{artifact.artifact_type}]:{artifact.artifact_id} finished")
+
+    async def _replace_embeddings(self, replacements: List[Tuple[str, list]]) -> None:
+        """
+        Replace the embeddings of artifacts, the old ones stay searchable until the new ones are stored
+
+        Args:
+            replacements: (artifact_id, new embeddings) pairs, the embeddings may be empty
+        """
+        if not replacements:
+            return
+        if len(replacements) == 1:
+            artifact_id, results = replacements[0]
+            await self.vector_db.areplace(self.default_vector_collection, {"artifact_id": artifact_id}, results)
+            return
+        # one bulk write for the whole batch instead of a read/upsert/delete round trip per artifact
+        await self.vector_db.areplace(self.default_vector_collection,
+                                      {"artifact_id": [artifact_id for artifact_id, _ in replacements]},
+                                      [result for _, results in replacements for result in results])
+
     async def _load_artifact_chunks(self, artifact: Artifact) -> Optional[list[Chunk]]:
-        return self.repository.get_chunks(artifact.artifact_id, artifact.parent_id)
+        return await asyncio.to_thread(self.repository.get_chunks, artifact.artifact_id, artifact.parent_id)
     
     async def save_artifact_chunks(self, artifact: Artifact, chunks: List[Chunk]) -> None:
         """Save artifact chunks"""
@@ -659,33 +1006,32 @@ class WorkSpace(BaseModel):
         """
         if not self.fulltext_db:
             return
-        if not chunks:
-            return
-            
+
         try:
             documents = []
 
             # default use origin text
             if chunks and self.workspace_config.fulltext_db_config.config.get('use_chunk', True):
-                # Store each chunk as a separate document
-                for chunk in chunks:
-                    doc = {
+                # Store each chunk as a separate document, per-artifact fields are resolved once
+                artifact_id = artifact.artifact_id
+                artifact_type = artifact.artifact_type.value
+                created_at = artifact.created_at
+                updated_at = artifact.updated_at
+                documents = [
+                    {
                         "id": chunk.chunk_id,
                         "content": chunk.content,
-                        "artifact_id": artifact.artifact_id,
+                        "artifact_id": artifact_id,
                         "chunk_id": chunk.chunk_id,
-                        "metadata": {
-                            "artifact_type": artifact.artifact_type.value,
-                            "chunk_index": chunk.chunk_metadata.chunk_index,
-                            "chunk_size": chunk.chunk_metadata.chunk_size,
-                            "chunk_overlap": chunk.chunk_metadata.chunk_overlap,
-                            **chunk.chunk_metadata.model_dump()
-                        },
-                        "created_at": artifact.created_at,
-                        "updated_at": artifact.updated_at
+                        # chunk_index/size/overlap are fields of chunk_metadata; it's a flat model without extras,
+                        # so its __dict__ holds exactly the field values and merges without building a dict per chunk
+                        "metadata": {"artifact_type": artifact_type, **chunk.chunk_metadata.__dict__},
+                        "created_at": created_at,
+                        "updated_at": updated_at
                     }
-                    documents.append(doc)
-            else:
+                    for chunk in chunks
+                ]
+            elif chunks:
                 # Store the entire artifact as a single document
                 content = artifact.get_embedding_text()
                 if content:
@@ -703,8 +1049,10 @@ class WorkSpace(BaseModel):
                     }
                     documents.append(doc)
             
+            # the previous documents of the artifact are only dropped once the new ones are written
+            await self.fulltext_db.areplace(self.full_text_index, {"artifact_id": artifact.artifact_id}, documents)
+            self._search_cache.clear()
             if documents:
-                await asyncio.to_thread(self.fulltext_db.insert, self.full_text_index, documents)
                 logger.info(f"📦[FULLTEXT]✅ store_fulltext[{artifact.artifact_type}]:{artifact.artifact_id} finished, {len(documents)} documents")
             else:
                 logger.warning(f"📦[FULLTEXT]⚠️ store_fulltext[{artifact.artifact_type}]:{artifact.artifact_id} no content to store")
@@ -728,9 +1076,6 @@ class WorkSpace(BaseModel):
             logger.warning(f"📦[FULLTEXT]⚠️ fulltext_db is not enabled for artifact {artifact.artifact_id}")
             return
             
-        # Delete existing full-text data for this artifact
-        self.fulltext_db.delete(self.full_text_index, filter={"artifact_id": artifact.artifact_id})
-        logger.info(f"📦[FULLTEXT]✅ delete_fulltext[{artifact.artifact_type}]:{artifact.artifact_id} finished")
         chunkable = artifact.get_metadata_value("chunkable")
         if chunkable and self.workspace_config.fulltext_db_config.config.get('use_chunk', True):
             if not chunks:
@@ -747,7 +1092,8 @@ class WorkSpace(BaseModel):
             return
             
         try:
-            self.fulltext_db.delete(self.workspace_id, filter={"artifact_id": artifact_id})
+            await self.fulltext_db.adelete(self.full_text_index, filter={"artifact_id": artifact_id})
+            self._search_cache.clear()
             logger.info(f"📦[FULLTEXT]✅ delete_fulltext for artifact_id: {artifact_id} finished")
         except Exception as e:
             logger.error(f"📦[FULLTEXT]❌ delete_fulltext for artifact_id: {artifact_id} failed: {e}")
@@ -766,8 +1112,7 @@ class WorkSpace(BaseModel):
         try:
             # Rebuild for all artifacts
             logger.info("📦[FULLTEXT]🔄 rebuilding fulltext for all artifacts")
-            for artifact in self.artifacts:
-                await self.rebuild_artifact_fulltext(artifact)
+            await self._rebuild_fulltext_of(list(self.artifacts), desc="workspace_rebuild_fulltext")
             logger.info("📦[FULLTEXT]✅ rebuild_fulltext completed for all artifacts")
 
         except Exception as e:
@@ -775,11 +1120,30 @@ class WorkSpace(BaseModel):
             raise
 
     async def rebuild_artifact_fulltext(self, artifact: Artifact):
-        await self._rebuild_artifact_fulltext(artifact)
-        for sub_artifact in tqdm(artifact.sublist, f"rebuild_artifact_fulltext_sublist#{artifact.artifact_id}"):
-            if not sub_artifact.content:
-                sub_artifact.content = self._get_file_content_by_artifact_id(artifact_id=sub_artifact.artifact_id, parent_id=artifact.artifact_id)
-            await self._rebuild_artifact_fulltext(sub_artifact)
+        await self._rebuild_fulltext_of([artifact], desc=f"rebuild_artifact_fulltext#{artifact.artifact_id}")
+
+    async def _rebuild_fulltext_of(self, artifacts: List[Artifact], desc: str) -> None:
+        """
+        Rebuild the fulltext documents of artifacts and their sub-artifacts concurrently
+
+        Args:
+            artifacts: Top-level artifacts to rebuild
+            desc: Progress bar description
+        """
+        semaphore = asyncio.Semaphore(getattr(self.workspace_config, 'max_concurrent_embeddings', 10))
+
+        async def _rebuild(artifact: Artifact, parent: Optional[Artifact]) -> None:
+            async with semaphore:
+                if parent is not None and not artifact.content:
+                    artifact.content = await asyncio.to_thread(
+                        self._get_file_content_by_artifact_id, artifact_id=artifact.artifact_id, parent_id=parent.artifact_id)
+                await self._rebuild_artifact_fulltext(artifact)
+
+        tasks = []
+        for artifact in artifacts:
+            tasks.append(_rebuild(artifact, None))
+            tasks.extend(_rebuild(sub_artifact, artifact) for sub_artifact in artifact.sublist or [])
+        await tqdm_asyncio.gather(*tasks, desc=desc)
 
     #########################################################
     # Artifact Retrieval
@@ -803,16 +1167,38 @@ class WorkSpace(BaseModel):
         Returns:
             List of artifacts
         """
+        unloaded = isinstance(self.artifacts, LazyList) and not self.artifacts.loaded
         if artifact_ids:
+            artifact_ids = frozenset(artifact_ids)
+            if unloaded and artifact_ids.isdisjoint(self._artifact_metas):
+                # the index already tells nothing matches, don't load the artifacts
+                return []
             return [a for a in self.artifacts if a.artifact_id in artifact_ids]
         if filter_types:
-            return [a for a in self.artifacts if a.artifact_type in filter_types]
+            filter_types = frozenset(filter_types)
+            if unloaded and not self.list_artifact_metas(filter_types):
+                return []
+            return self._list_artifacts_of_types(filter_types)
         if not sublist:
             return [a for a in self.artifacts]
         return self.total_artifacts
 
 
     
+    def _list_artifacts_of_types(self, filter_types: frozenset) -> List[Artifact]:
+        """Top-level artifacts of the given types in workspace order, looked up through the type index"""
+        if self._indexed_sublist_sizes is None or len(self._indexed_sublist_sizes) != len(self.artifacts):
+            self._reindex_artifacts()
+        positions = []
+        for artifact_type in filter_types:
+            for artifact_id in self._type_index.get(artifact_type, ()):
+                position = self._get_artifact_position(artifact_id)
+                # the type index also holds sub-artifacts
+                if position is not None and position[0] is self.artifacts:
+                    positions.append(position[1])
+        artifacts = self.artifacts
+        return [artifacts[i] for i in sorted(positions)]
+
     def get_artifact(self, artifact_id: str, parent_id: str = None, load_content:bool = True, load_summary = True) -> Optional[Artifact]:
         """
         Get an artifact by its ID
@@ -824,65 +1210,235 @@ class WorkSpace(BaseModel):
             Artifact object if found, None otherwise
         """
         if parent_id:
-            parent_artifact = self.get_artifact(artifact_id=parent_id)
-            if parent_artifact:
-                if not parent_artifact.sublist:
-                    return None
-                for sub_artifact in parent_artifact.sublist:
-                    if sub_artifact.artifact_id == artifact_id:
-                        if load_content:
-                            sub_artifact.content = self.repository.get_subaritfact_content(artifact_id, parent_id)
-                        if load_summary:
-                            if self.vector_db:
-                                summary_result = self.vector_db.query(self.summary_vector_collection, filter={
-                                    "artifact_id": sub_artifact.artifact_id
-                                })
-                                if summary_result and len(summary_result.docs) > 0:
-                                    sub_artifact.summary = summary_result.docs[0].content
-                        return sub_artifact
+            sub_artifact = self._get_sub_artifact(parent_id, artifact_id)
+            if sub_artifact:
+                if load_content:
+                    sub_artifact.content = self.repository.get_subaritfact_content(artifact_id, parent_id)
+                if load_summary:
+                    if self.vector_db:
+                        summary_result = self.vector_db.query(self.summary_vector_collection, filter={
+                            "artifact_id": sub_artifact.artifact_id
+                        })
+                        if summary_result and len(summary_result.docs) > 0:
+                            sub_artifact.summary = summary_result.docs[0].content
+                return sub_artifact
+            if self._get_artifact(parent_id):
                 return None
 
         return self._get_artifact(artifact_id)
 
+    def get_artifacts(self, artifact_refs: List[Tuple[str, Optional[str]]]) -> Dict[str, Artifact]:
+        """
+        Look up several artifacts at once, without loading their content or summary
+
+        The id indexes are refreshed at most once for the whole batch instead of once per missing artifact.
+
+        Args:
+            artifact_refs: (artifact_id, parent_id) pairs, parent_id is empty for top-level artifacts
+
+        Returns:
+            Found artifacts keyed by artifact_id
+        """
+        def lookup(artifact_id: str, parent_id: Optional[str]) -> Optional[Artifact]:
+            if parent_id:
+                sub_artifact = self._sub_artifact_index.get((parent_id, artifact_id))
+                if sub_artifact or parent_id in self._artifact_index:
+                    return sub_artifact
+            return self._artifact_index.get(artifact_id)
+
+        artifacts: Dict[str, Artifact] = {}
+        missing = []
+        for artifact_id, parent_id in artifact_refs:
+            artifact = lookup(artifact_id, parent_id)
+            if artifact is None:
+                missing.append((artifact_id, parent_id))
+            else:
+                artifacts.setdefault(artifact_id, artifact)
+        if missing:
+            self._refresh_artifact_index()
+            for artifact_id, parent_id in missing:
+                artifact = lookup(artifact_id, parent_id)
+                if artifact is not None:
+                    artifacts.setdefault(artifact_id, artifact)
+        return artifacts
+
+    def get_artifact_meta(self, artifact_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the entry of an artifact in the workspace index (artifact_id, type, metadata)
+
+        Unlike get_artifact this never materializes the workspace artifacts.
+
+        Args:
+            artifact_id: Artifact ID
+
+        Returns:
+            Index entry as of the last load/save, None if the artifact isn't indexed
+        """
+        entry = self._artifact_metas.get(artifact_id)
+        if entry is None:
+            return None
+        artifact_type, metadata = entry
+        return {"artifact_id": artifact_id, "type": artifact_type, "metadata": metadata}
+
+    def list_artifact_metas(self, filter_types: Optional[List[ArtifactType]] = None) -> List[Dict[str, Any]]:
+        """
+        List the workspace index entries (artifact_id, type, metadata) of the top-level artifacts
+
+        Like get_artifact_meta this never materializes the workspace artifacts, use it when the
+        artifact contents aren't needed.
+
+        Args:
+            filter_types: Optional artifact types to keep
+
+        Returns:
+            Index entries in workspace order
+        """
+        self._apply_dirty_artifact_metas()
+        type_names = {str(t) for t in filter_types} if filter_types else None
+        return [{"artifact_id": artifact_id, "type": artifact_type, "metadata": metadata}
+                for artifact_id, (artifact_type, metadata) in self._artifact_metas.items()
+                if type_names is None or artifact_type in type_names]
+
     def get_next_artifact(self, artifact_id: str) -> Optional[Artifact]:
-        for i, artifact in enumerate(self.artifacts):
-            if artifact.artifact_id == artifact_id:
-                if i + 1 >= len(self.artifacts):
-                    return None
-                return self.artifacts[i + 1]
-            if artifact.sublist:
-                for si, sub_artifact in enumerate(artifact.sublist):
-                    if sub_artifact.artifact_id == artifact_id:
-                        if si + 1 >= len(artifact.sublist):
-                            return None
-                        return artifact.sublist[si + 1]
-        return None
+        position = self._get_artifact_position(artifact_id)
+        if position is None:
+            return None
+        container, i = position
+        if i + 1 >= len(container):
+            return None
+        return container[i + 1]
 
     def get_pre_artifact(self, artifact_id: str) -> Optional[Artifact]:
-        for i, artifact in enumerate(self.artifacts):
-            if artifact.artifact_id == artifact_id:
-                if i - 1 < 0:
-                    return None
-                return self.artifacts[i - 1]
-            if artifact.sublist:
-                for si,sub_artifact in enumerate(artifact.sublist):
-                    if sub_artifact.artifact_id == artifact_id:
-                        if si - 1 < 0:
-                            return None
-                        return artifact.sublist[si - 1]
+        position = self._get_artifact_position(artifact_id)
+        if position is None:
+            return None
+        container, i = position
+        if i - 1 < 0:
+            return None
+        return container[i - 1]
+
+    def _get_artifact_position(self, artifact_id: str) -> Optional[Tuple[List[Artifact], int]]:
+        """
+        Locate an artifact in its containing list (workspace artifacts or a parent's sublist)
+
+        Args:
+            artifact_id: Artifact ID
+
+        Returns:
+            (container list, position) if found, None otherwise
+        """
+        position = self._resolve_artifact_position(artifact_id)
+        if position is None:
+            # positions shift on insert/delete, rebuild when the cached one no longer matches
+            self._reposition_artifacts()
+            position = self._resolve_artifact_position(artifact_id)
+        return position
+
+    def _get_top_level_position(self, artifact_id: str) -> Optional[int]:
+        """Position of a top-level artifact in self.artifacts, None if there is no top-level artifact with that id"""
+        position = self._get_artifact_position(artifact_id)
+        if position is None:
+            return None
+        if position[0] is self.artifacts:
+            return position[1]
+        # the id is taken by a sub-artifact listed first, fall back to scanning the top level
+        return next((i for i, a in enumerate(self.artifacts) if a.artifact_id == artifact_id), None)
+
+    def _resolve_artifact_position(self, artifact_id: str) -> Optional[Tuple[List[Artifact], int]]:
+        entry = self._artifact_positions.get(artifact_id)
+        if entry is None:
+            return None
+        owner, i = entry
+        container = self.artifacts if owner is None else owner.sublist
+        if not container or i >= len(container) or container[i].artifact_id != artifact_id:
+            return None
+        return container, i
 
-        return None
+    def _reposition_artifacts(self) -> None:
+        """Rebuild the position map, first occurrence wins like the previous linear scan"""
+        positions: Dict[str, Tuple[Optional[Artifact], int]] = {}
+        for i, artifact in enumerate(self.artifacts):
+            positions.setdefault(artifact.artifact_id, (None, i))
+            for si, sub_artifact in enumerate(artifact.sublist or []):
+                positions.setdefault(sub_artifact.artifact_id, (artifact, si))
+        self._artifact_positions = positions
 
     def _get_artifact(self, artifact_id: str) -> Optional[Artifact]:
+        artifact = self._artifact_index.get(artifact_id)
+        if artifact is None:
+            # sublists may grow after an artifact was added (e.g. in post_process), refresh the index on a miss
+            self._refresh_artifact_index()
+            artifact = self._artifact_index.get(artifact_id)
+        return artifact
+
+    def _get_sub_artifact(self, parent_id: str, artifact_id: str) -> Optional[Artifact]:
+        sub_artifact = self._sub_artifact_index.get((parent_id, artifact_id))
+        if sub_artifact is None:
+            self._refresh_artifact_index()
+            sub_artifact = self._sub_artifact_index.get((parent_id, artifact_id))
+        return sub_artifact
+
+    def _index_artifact(self, artifact: Artifact) -> None:
+        """Register an artifact and its sub-artifacts in the id indexes"""
+        for sub_artifact in artifact.sublist or []:
+            self._artifact_index[sub_artifact.artifact_id] = sub_artifact
+            self._sub_artifact_index[(artifact.artifact_id, sub_artifact.artifact_id)] = sub_artifact
+            self._type_index.setdefault(sub_artifact.artifact_type, set()).add(sub_artifact.artifact_id)
+        self._artifact_index[artifact.artifact_id] = artifact
+        self._type_index.setdefault(artifact.artifact_type, set()).add(artifact.artifact_id)
+        if self._indexed_sublist_sizes is not None:
+            self._indexed_sublist_sizes[artifact.artifact_id] = len(artifact.sublist or [])
+
+    def _unindex_artifact(self, artifact: Artifact) -> None:
+        """Remove an artifact and its sub-artifacts from the id indexes"""
+        for sub_artifact in artifact.sublist or []:
+            self._artifact_index.pop(sub_artifact.artifact_id, None)
+            self._sub_artifact_index.pop((artifact.artifact_id, sub_artifact.artifact_id), None)
+            self._type_index.get(sub_artifact.artifact_type, set()).discard(sub_artifact.artifact_id)
+        self._artifact_index.pop(artifact.artifact_id, None)
+        self._type_index.get(artifact.artifact_type, set()).discard(artifact.artifact_id)
+        if self._indexed_sublist_sizes is not None:
+            self._indexed_sublist_sizes.pop(artifact.artifact_id, None)
+
+    def _refresh_artifact_index(self) -> None:
+        """
+        Bring the id indexes up to date after a lookup miss
+
+        Only sublists whose length changed since they were indexed are re-indexed, so looking up
+        an unknown id (e.g. in add_artifact) doesn't rebuild the whole index.
+        """
+        sizes = self._indexed_sublist_sizes
+        if sizes is None or len(sizes) != len(self.artifacts):
+            self._reindex_artifacts()
+            return
         for artifact in self.artifacts:
-            if artifact.artifact_id == artifact_id:
-                return artifact
-            if artifact.sublist:
-                for sub_artifact in artifact.sublist:
-                    if sub_artifact.artifact_id == artifact_id:
-                        return sub_artifact
-        return None
+            if sizes.get(artifact.artifact_id) != len(artifact.sublist or []):
+                self._index_artifact(artifact)
+
+    def _reindex_artifacts(self) -> None:
+        """Rebuild the id indexes from self.artifacts, top-level artifacts win over sub-artifacts"""
+        self._artifact_index = {}
+        self._sub_artifact_index = {}
+        self._type_index = {}
+        self._indexed_sublist_sizes = {}
+        for artifact in reversed(self.artifacts):
+            self._index_artifact(artifact)
     
+    async def _load_artifact_index(self) -> None:
+        """Build the id indexes in a worker thread, the first build materializes the workspace artifacts"""
+        if self._indexed_sublist_sizes is None:
+            await asyncio.to_thread(self._refresh_artifact_index)
+
+    def _excluded_by_type(self, artifact_id: str, filter_types: Optional[List[ArtifactType]]) -> bool:
+        """
+        Whether the type index already tells the artifact is not of filter_types, without fetching it
+
+        Artifacts that aren't indexed yet are never excluded, the caller checks them after get_artifact.
+        """
+        if not filter_types or artifact_id not in self._artifact_index:
+            return False
+        return not any(artifact_id in self._type_index.get(artifact_type, ()) for artifact_type in filter_types)
+
     def get_file_content_by_artifact_id(self, artifact_id: str, parent_id: str = None) -> Optional[str]:
         """
         Get concatenated content of all artifacts with the same filename.
@@ -899,10 +1455,27 @@ class WorkSpace(BaseModel):
         return self._get_file_content_by_artifact_id(artifact.artifact_id, artifact.parent_id)
 
     def _get_file_content_by_artifact_id(self, artifact_id: str, parent_id: str = None) -> Optional[str]:
-        if parent_id:
-            return self.repository.get_subaritfact_content(artifact_id, parent_id)
-        else:
+        if not parent_id:
             return None
+        cache_key = (parent_id, artifact_id)
+        with self._content_cache_lock:
+            content = self._content_cache.get(cache_key)
+            if content is not None:
+                self._content_cache.move_to_end(cache_key)
+                return content
+        content = self.repository.get_subaritfact_content(artifact_id, parent_id)
+        if content is not None:
+            with self._content_cache_lock:
+                self._content_cache[cache_key] = content
+                if len(self._content_cache) > CONTENT_CACHE_SIZE:
+                    self._content_cache.popitem(last=False)
+        return content
+
+    def _invalidate_content_cache(self, artifact_id: str) -> None:
+        """Drop the cached contents of an artifact and of its sub-artifacts after it was written"""
+        with self._content_cache_lock:
+            for cache_key in [key for key in self._content_cache if artifact_id in key]:
+                del self._content_cache[cache_key]
 
     async def get_attachment_file_stream(self, artifact_id: str, file_name: str) -> Optional[bytes]:
         """
@@ -1015,62 +1588,176 @@ class WorkSpace(BaseModel):
 
         if not search_query.threshold:
             search_query.threshold = self.workspace_config.hybrid_search_config.threshold
-        logger.debug(f"🔍 retrieve_artifact final search_query: {search_query}")
+        logger.debug("🔍 retrieve_artifact final search_query: %s", search_query)
 
-        candidate_results = []
+        # artifact_id -> artifact, deduplicated across the search branches while they are collected
+        candidate_results: Dict[str, Artifact] = {}
 
-        # Execute vector and fulltext search concurrently
-        vector_task = asyncio.create_task(self._vector_search_artifacts(search_query))
-        vector_summary_task = asyncio.create_task(self._vector_search_artifacts_by_summary(search_query))
+        # Execute vector and fulltext search concurrently, embedding the query once for both vector searches,
+        # while the artifact index the search hits are resolved against is built off the event loop
+        index_task = asyncio.create_task(self._load_artifact_index())
         fulltext_task = asyncio.create_task(self._fulltext_search_artifacts(search_query))
+        query_embedding = await self._embed_query(search_query.query) if self.vector_db else None
+        vector_task = asyncio.create_task(self._vector_search_artifacts(search_query, query_embedding))
+        vector_summary_task = asyncio.create_task(self._vector_search_artifacts_by_summary(search_query, query_embedding))
+
+        # Start loading candidate contents as soon as a search branch finishes instead of after all of them
+        content_tasks: Dict[str, asyncio.Task] = {}
+        for completed in asyncio.as_completed([vector_task, fulltext_task, vector_summary_task]):
+            self._prefetch_candidate_contents(await completed, content_tasks)
+        await index_task
+        vector_results, fulltext_results, vector_summary_results = (
+            vector_task.result(), fulltext_task.result(), vector_summary_task.result()
+        )
 
-        vector_results, fulltext_results,  vector_summary_results = await asyncio.gather(vector_task, fulltext_task, vector_summary_task)
-
-        if vector_results:
-            candidate_results += [vector_result.artifact for vector_result in vector_results]
-            logger.info(f"🔍 retrieve_artifact vector_results size: {len(vector_results)}")
-            for item in vector_results:
-                logger.debug(f"🔍 retrieve_artifact vector_results item: {item.artifact.artifact_id}: {item.score}")
-
-        if vector_summary_results:
-            candidate_results += [vector_summary_result.artifact for vector_summary_result in vector_summary_results]
-            logger.info(f"🔍 retrieve_artifact vector_results size: {len(vector_summary_results)}")
-            for item in vector_summary_results:
-                logger.debug(f"🔍 retrieve_artifact vector_results item: {item.artifact.artifact_id}: {item.score}")
-
-        if fulltext_results:
-            candidate_results += [fulltext_result.artifact for fulltext_result in fulltext_results]
-            logger.info(f"🔍 retrieve_artifact fulltext_results size: {len(fulltext_results)}")
-            for item in fulltext_results:
-                logger.debug(f"🔍 retrieve_artifact fulltext_results item: {item.artifact.artifact_id}: {item.score}")
+        confident_results = self._confident_branch_results(search_query, [vector_results, vector_summary_results,
+                                                                          fulltext_results])
+        if confident_results is not None:
+            await self._load_candidate_contents([result.artifact for result in confident_results], content_tasks)
+            logger.info(f"🔍 retrieve_artifact skipped rerank, results size: {len(confident_results)}")
+            return confident_results
 
-        if fulltext_results:
-            candidate_results += [fulltext_result.artifact for fulltext_result in fulltext_results]
-            logger.info(f"🔍 retrieve_artifact fulltext_results size: {len(fulltext_results)}")
-            for item in fulltext_results:
-                logger.debug(f"🔍 retrieve_artifact fulltext_results item: {item.artifact.artifact_id}: {item.score}")
+        self._extend_candidates(candidate_results, "vector_results", vector_results)
+        self._extend_candidates(candidate_results, "vector_summary_results", vector_summary_results)
+        self._extend_candidates(candidate_results, "fulltext_results", fulltext_results)
 
         logger.info(f"🔍 retrieve_artifact candidate_results size: {len(candidate_results)}")
-        rerank_results = await self._rerank_candidate_artifacts(search_query.query,candidate_results)
-        for item in rerank_results:
-            logger.debug(f"🔍 retrieve_artifact rerank_results item: {item.artifact.artifact_id}: {item.score}")
+        rerank_results = await self._rerank_candidate_artifacts(search_query.query, candidate_results,
+                                                                top_k=search_query.limit, content_tasks=content_tasks)
+        if logger.isEnabledFor(logging.DEBUG):
+            for item in rerank_results:
+                logger.debug("🔍 retrieve_artifact rerank_results item: %s: %s", item.artifact.artifact_id, item.score)
 
-        # Convert rerank results to HybridSearchResults and limit to requested size
+        # Convert rerank results (already limited to top_k) to HybridSearchResults, their fields are validated already
         results = [
-            HybridSearchResult(artifact=result.artifact, score=result.score)
-            for result in rerank_results[:search_query.limit]
+            HybridSearchResult.model_construct(artifact=result.artifact, score=result.score)
+            for result in rerank_results
         ]
 
         logger.info(f"🔍 retrieve_artifact results size: {len(results)}")
         return results
 
+    async def retrieve_artifacts_batch(self, search_queries: List[HybridSearchQuery]) -> List[Optional[list[HybridSearchResult]]]:
+        """
+        Retrieve artifacts for several queries, embedding all queries with one batched embedder request
+
+        Args:
+            search_queries: Search queries
+
+        Returns:
+            Results of each query, in the order of search_queries
+        """
+        if self.vector_db and self.workspace_config.hybrid_search_config.enabled:
+            await self._embed_queries([search_query.query for search_query in search_queries
+                                       if search_query and search_query.query])
+        return list(await asyncio.gather(*[self.retrieve_artifacts(search_query) for search_query in search_queries]))
+
+    def _confident_branch_results(self, search_query: HybridSearchQuery,
+                                  branch_results: List[Optional[List[HybridSearchResult]]]) -> Optional[List[HybridSearchResult]]:
+        """
+        Results that can skip the reranker: only one search branch found anything, no more than the limit,
+        and every score reaches skip_rerank_threshold. Scores of a single branch need no reconciliation.
+
+        Returns:
+            The branch results sorted by score (descending), None if they must be reranked
+        """
+        threshold = self.workspace_config.hybrid_search_config.skip_rerank_threshold
+        if threshold is None:
+            return None
+        non_empty = [results for results in branch_results if results]
+        if len(non_empty) != 1 or len(non_empty[0]) > search_query.limit:
+            return None
+        if any(result.score < threshold for result in non_empty[0]):
+            return None
+        return sorted(non_empty[0], key=lambda x: x.score, reverse=True)
+
+    @staticmethod
+    def _extend_candidates(candidate_results: Dict[str, Artifact], source_name: str,
+                           results: Optional[List[HybridSearchResult]]) -> None:
+        """Add the artifacts of one search branch to the rerank candidates, the first branch finding an artifact wins"""
+        if not results:
+            return
+        for result in results:
+            candidate_results.setdefault(result.artifact.artifact_id, result.artifact)
+        logger.info("🔍 retrieve_artifact %s size: %d", source_name, len(results))
+        if logger.isEnabledFor(logging.DEBUG):
+            for item in results:
+                logger.debug("🔍 retrieve_artifact %s item: %s: %s", source_name, item.artifact.artifact_id, item.score)
+
+    def _prefetch_candidate_contents(self, results: Optional[List[HybridSearchResult]],
+                                     content_tasks: Dict[str, asyncio.Task]) -> None:
+        """Schedule loading the content of result artifacts that come without one, at most once per artifact"""
+        for result in results or ():
+            artifact = result.artifact
+            if artifact.content or not artifact.parent_id or artifact.artifact_id in content_tasks:
+                continue
+            content_tasks[artifact.artifact_id] = asyncio.create_task(asyncio.to_thread(
+                self._get_file_content_by_artifact_id, artifact.artifact_id, artifact.parent_id))
+
+    async def _load_candidate_contents(self, candidates: List[Artifact],
+                                       content_tasks: Optional[Dict[str, asyncio.Task]] = None) -> None:
+        """Load the missing contents of deduplicated candidates concurrently, reusing already scheduled loads"""
+        content_tasks = content_tasks or {}
+        needs_content = [result for result in candidates if not result.content]
+        contents = await asyncio.gather(*[
+            content_tasks.get(result.artifact_id) or asyncio.to_thread(
+                self._get_file_content_by_artifact_id, result.artifact_id, result.parent_id)
+            for result in needs_content
+        ])
+        for result, content in zip(needs_content, contents):
+            result.content = content
+
+    async def _rerank_candidate_artifacts(self, user_message: str, candidate_results: Dict[str, Artifact],
+                                          top_k: int,
+                                          content_tasks: Optional[Dict[str, asyncio.Task]] = None) -> List[RerankResult]:
+        """
+        Rerank the candidate artifacts, keeping the top_k best
+
+        Args:
+            user_message: Query string
+            candidate_results: Deduplicated candidate artifacts from all search branches, keyed by artifact_id
+            top_k: Number of results to keep
+            content_tasks: Already scheduled content loads keyed by artifact_id
+
+        Returns:
+            Rerank results sorted by score (descending), at most top_k
+        """
+        if not candidate_results:
+            return []
+
+        # the same query over the same candidates (e.g. paging through results) reuses the previous ranking
+        cache_key = (" ".join(user_message.split()), frozenset(candidate_results), top_k)
+        rerank_results = self._rerank_cache.get(cache_key)
+        if rerank_results is None:
+            candidates = list(candidate_results.values())
+            await self._load_candidate_contents(candidates, content_tasks)
+            rerank_results = await self._run_reranker(user_message, candidates, top_k)
+            self._rerank_cache.put(cache_key, rerank_results)
+        return list(rerank_results)
+
+    async def _run_reranker(self, user_message: str, candidates: List[Artifact], top_k: int) -> List[RerankResult]:
+        """Rerank the candidates off the event loop, splitting them into batches of rerank_batch_size"""
+        batch_size = self.workspace_config.hybrid_search_config.rerank_batch_size
+        if not batch_size or len(candidates) <= batch_size:
+            return await asyncio.to_thread(self.reranker.run, user_message, candidates, top_n=top_k)
+
+        # Rerank the candidates in batches on a bounded number of threads and merge the best of each batch
+        semaphore = asyncio.Semaphore(max(1, self.workspace_config.hybrid_search_config.rerank_max_concurrency))
+
+        async def _rerank_batch(batch: List[Artifact]) -> List[RerankResult]:
+            async with semaphore:
+                return await asyncio.to_thread(self.reranker.run, user_message, batch, top_n=top_k)
+
+        batch_results = await asyncio.gather(*[
+            _rerank_batch(candidates[i:i + batch_size]) for i in range(0, len(candidates), batch_size)
+        ])
+        return heapq.nlargest(top_k, itertools.chain.from_iterable(batch_results), key=lambda x: x.score)
+
     async def _fulltext_search_chunks(self, search_query: ChunkSearchQuery) -> Dict[str, Chunk]:
         if not self.fulltext_db:
             return {}
-        fulltext_search_results = await asyncio.to_thread(
-            self.fulltext_db.search,
-            self.full_text_index, search_query.query,
-            filter=search_query.filters, limit=search_query.limit
+        fulltext_search_results = await self._search_fulltext_db(
+            search_query.query, filter=search_query.filters, limit=search_query.limit
         )
         chunks = {}
         if fulltext_search_results and fulltext_search_results.results:
@@ -1093,10 +1780,125 @@ class WorkSpace(BaseModel):
                     chunks[result.chunk_id] = chunk
         return chunks
 
-    async def _vector_search_chunks(self, search_query: ChunkSearchQuery) -> Dict[str, Chunk]:
-        chunk_query_embedding = self.embedder.embed_query(search_query.query)
-        vector_search_results = await asyncio.to_thread(
-            self.vector_db.search, self.default_vector_collection, [chunk_query_embedding],
+    async def _embed_query(self, query: str) -> List[float]:
+        """Embed query text, reusing the embedding of recently searched queries"""
+        # keyed by model so a changed embedding config never serves vectors from another model
+        cache_key = (self.workspace_config.embedding_config.model_name, query)
+        query_embedding = self._query_embedding_cache.get(cache_key)
+        if query_embedding is not None:
+            self._query_embedding_cache.move_to_end(cache_key)
+            return query_embedding
+        query_embedding = await asyncio.to_thread(self.embedder.embed_query, query)
+        self._cache_query_embedding(cache_key, query_embedding)
+        return query_embedding
+
+    async def _embed_queries(self, queries: List[str]) -> None:
+        """Embed the queries missing from the query embedding cache in one batched embedder request"""
+        model_name = self.workspace_config.embedding_config.model_name
+        missing = [query for query in dict.fromkeys(queries) if (model_name, query) not in self._query_embedding_cache]
+        if not missing:
+            return
+        embeddings = await self.embedder.async_embed_texts(missing)
+        for query, query_embedding in zip(missing, embeddings):
+            self._cache_query_embedding((model_name, query), query_embedding)
+
+    def _cache_query_embedding(self, cache_key: Tuple[str, str], query_embedding: List[float]) -> None:
+        self._query_embedding_cache[cache_key] = query_embedding
+        self._query_embedding_cache.move_to_end(cache_key)
+        if len(self._query_embedding_cache) > QUERY_EMBEDDING_CACHE_SIZE:
+            self._query_embedding_cache.popitem(last=False)
+
+    async def _search_fulltext_db(self, query: str, filter: Optional[Dict[str, Any]] = None,
+                                  limit: int = 10, offset: int = 0) -> Optional[FulltextSearchResults]:
+        """Run fulltext_db.search off the event loop, serving repeated queries from the search cache"""
+        cache_key = ("fulltext", self.full_text_index, query,
+                     json.dumps(filter, sort_keys=True, default=str), limit, offset)
+        search_results = self._search_cache.get(cache_key)
+        if search_results is None:
+            search_results = await asyncio.to_thread(
+                self.fulltext_db.search, self.full_text_index, query,
+                filter=filter, limit=limit, offset=offset
+            )
+            if search_results is not None:
+                self._search_cache.put(cache_key, search_results)
+        return search_results
+
+    async def _search_vector_db(self, collection_name: str, query: str, query_embedding: List[float],
+                                filter: Optional[dict], threshold: float, limit: int) -> Optional[EmbeddingsResults]:
+        """Run vector_db.search off the event loop, serving repeated queries from the search cache"""
+        cache_key = ("vector", collection_name, query,
+                     json.dumps(filter, sort_keys=True, default=str), threshold, limit)
+        search_results = self._search_cache.get(cache_key)
+        if search_results is None:
+            search_results = await asyncio.to_thread(
+                self.vector_db.search, collection_name, [query_embedding],
+                filter=filter, threshold=threshold, limit=limit
+            )
+            if search_results is not None:
+                self._search_cache.put(cache_key, search_results)
+        return search_results
+
+    async def _vector_search_artifacts(self, search_query: HybridSearchQuery,
+                                       query_embedding: Optional[List[float]] = None) -> Optional[list[HybridSearchResult]]:
+        """Search artifacts by the embeddings of their content"""
+        return await self._vector_search_artifacts_in_collection(
+            self.default_vector_collection, search_query, query_embedding)
+
+    async def _vector_search_artifacts_by_summary(self, search_query: HybridSearchQuery,
+                                                  query_embedding: Optional[List[float]] = None) -> Optional[list[HybridSearchResult]]:
+        """Search artifacts by the embeddings of their summaries"""
+        return await self._vector_search_artifacts_in_collection(
+            self.summary_vector_collection, search_query, query_embedding)
+
+    async def _vector_search_artifacts_in_collection(self, collection_name: str, search_query: HybridSearchQuery,
+                                                     query_embedding: Optional[List[float]] = None) -> Optional[list[HybridSearchResult]]:
+        if not self.vector_db:
+            return None
+        try:
+            if query_embedding is None:
+                query_embedding = await self._embed_query(search_query.query)
+            # Let the vector db skip other artifact types instead of dropping them after the search
+            filter_dict = {}
+            if search_query.filter_types:
+                filter_dict["artifact_type"] = [t.value for t in search_query.filter_types]
+            search_results = await self._search_vector_db(
+                collection_name, search_query.query, query_embedding,
+                filter=filter_dict, threshold=search_query.threshold, limit=search_query.limit
+            )
+            if not search_results or not search_results.docs:
+                logger.info(f"🔍 _vector_search_artifacts[{collection_name}] no results found")
+                return None
+
+            docs = [doc for doc in search_results.docs if doc.metadata
+                    and not self._excluded_by_type(doc.metadata.artifact_id, search_query.filter_types)]
+            artifacts = self.get_artifacts([(doc.metadata.artifact_id, doc.metadata.parent_id) for doc in docs])
+
+            results = []
+            existing_artifact_ids: set[str] = set()
+            for doc in docs:
+                if doc.metadata.artifact_id in existing_artifact_ids:
+                    continue
+                artifact = artifacts.get(doc.metadata.artifact_id)
+                if not artifact:
+                    logger.warning(f"🔍 _vector_search_artifacts artifact not found: {doc.metadata.artifact_id}")
+                    continue
+                if search_query.filter_types and artifact.artifact_type not in search_query.filter_types:
+                    continue
+                results.append(HybridSearchResult.model_construct(artifact=artifact, score=doc.score))
+                existing_artifact_ids.add(doc.metadata.artifact_id)
+
+            logger.info(f"🔍 _vector_search_artifacts[{collection_name}] found {len(results)} results")
+            return results
+        except Exception as e:
+            logger.error(f"🔍 _vector_search_artifacts[{collection_name}] failed: {e}")
+            return None
+
+    async def _vector_search_chunks(self, search_query: ChunkSearchQuery,
+                                    query_embedding: Optional[List[float]] = None) -> Dict[str, Chunk]:
+        if query_embedding is None:
+            query_embedding = await self._embed_query(search_query.query)
+        vector_search_results = await self._search_vector_db(
+            self.default_vector_collection, search_query.query, query_embedding,
             filter=search_query.filters, threshold=search_query.threshold, limit=search_query.limit
         )
         chunks = {}
@@ -1135,8 +1937,9 @@ class WorkSpace(BaseModel):
             
         """
         # 1. Vector and Full-text search in parallel (z)
-        fulltext_task = self._fulltext_search_chunks(search_query)
-        vector_task = self._vector_search_chunks(search_query)
+        fulltext_task = asyncio.create_task(self._fulltext_search_chunks(search_query))
+        query_embedding = await self._embed_query(search_query.query)
+        vector_task = self._vector_search_chunks(search_query, query_embedding)
 
         fulltext_chunks, vector_chunks = await asyncio.gather(
             fulltext_task, vector_task
@@ -1145,55 +1948,48 @@ class WorkSpace(BaseModel):
         logger.info(f"🔍 retrieve_chunk fulltext_search_chunks: {len(fulltext_chunks.keys())}")
 
         # 2. & 3. Combine and deduplicate chunks for reranking (z)
-        combined_chunks: Dict[str, Chunk] = {}
-        combined_chunks.update(fulltext_chunks)
-        for chunk_id, chunk in vector_chunks.items():
-            if chunk_id not in combined_chunks:
-                combined_chunks[chunk_id] = chunk
-        
+        # fulltext chunks win when both searches returned the same chunk
+        combined_chunks: Dict[str, Chunk] = vector_chunks | fulltext_chunks
+
         logger.info(f"🔍 retrieve_chunk combined_chunks final size: {len(combined_chunks)}")
 
         if not combined_chunks:
             return []
 
         # Helper function for fallback to vector search results (z)
-        async def _fallback_to_vector_search() -> List[ChunkSearchResult]:
+        async def _fallback_to_vector_search(vector_search_results: Dict[str, Chunk]) -> List[ChunkSearchResult]:
             """Fallback mechanism when reranker is not available or fails (z)"""
             logger.warning("🔄 Using fallback to vector search results")
-            results = []
-            # Use vector search results as fallback
-            vector_search_results = await self._vector_search_chunks(search_query)
+            # Use vector search results (already fetched above) as fallback
             if not vector_search_results:
                 return []
-            
+
             # Convert chunks to search results with context window
-            for chunk in list(vector_search_results.values())[:search_query.limit]:
-                pre_n_chunks, chunk_obj, next_n_chunks = await asyncio.to_thread(
-                    self.repository.get_chunk_window, 
-                    chunk.chunk_metadata.artifact_id, 
-                    chunk.chunk_metadata.parent_artifact_id,
-                    chunk.chunk_metadata.chunk_index, 
-                    search_query.pre_n, 
-                    search_query.next_n
+            windows = await asyncio.to_thread(
+                self.repository.get_chunk_windows,
+                [self._chunk_window_item(chunk, search_query)
+                 for chunk in list(vector_search_results.values())[:search_query.limit]]
+            )
+            return [
+                ChunkSearchResult(
+                    pre_n_chunks=pre_n_chunks,
+                    chunk=chunk_obj,
+                    next_n_chunks=next_n_chunks,
+                    score=1.0  # Default score for fallback
                 )
-                if chunk_obj:
-                    results.append(ChunkSearchResult(
-                        pre_n_chunks=pre_n_chunks, 
-                        chunk=chunk_obj,
-                        next_n_chunks=next_n_chunks, 
-                        score=1.0  # Default score for fallback
-                    ))
-            return results
+                for pre_n_chunks, chunk_obj, next_n_chunks in windows if chunk_obj
+            ]
 
         # Fallback to vector search if reranker is not available (z)
         if not self.reranker:
             logger.warning("⚠️ Reranker is not available, using fallback mechanism")
-            return await _fallback_to_vector_search()
+            return await _fallback_to_vector_search(vector_chunks)
 
         # 4. Rerank with error handling and fallback (z)
         try:
+            # rerankers only read the text, skip validation and version bookkeeping of full Artifact init
             artifacts_to_rerank = [
-                Artifact(
+                Artifact.model_construct(
                     artifact_id=chunk.chunk_id, content=chunk.content,
                     artifact_type=ArtifactType.TEXT, metadata={'original_chunk': chunk}
                 ) for chunk in combined_chunks.values()
@@ -1205,27 +2001,29 @@ class WorkSpace(BaseModel):
 
             if not reranked_results:
                 logger.warning("⚠️ Rerank returned empty results, using fallback mechanism")
-                return await _fallback_to_vector_search()
+                return await _fallback_to_vector_search(vector_chunks)
                 
         except Exception as e:
             logger.error(f"❌ Rerank failed with error: {e}, using fallback mechanism")
-            return await _fallback_to_vector_search()
+            return await _fallback_to_vector_search(vector_chunks)
 
         # 5. Get context window for final results and format (z)
-        window_fetch_tasks = []
-        for rerank_result in reranked_results:
-            original_chunk: Chunk = rerank_result.artifact.metadata['original_chunk']
-            async def fetch_window(chunk, score):
-                pre_n, c, next_n = await asyncio.to_thread(
-                    self.repository.get_chunk_window, chunk.chunk_metadata.artifact_id, chunk.chunk_metadata.parent_artifact_id,
-                    chunk.chunk_metadata.chunk_index, search_query.pre_n, search_query.next_n
-                )
-                return ChunkSearchResult(
-                    pre_n_chunks=pre_n, chunk=c, next_n_chunks=next_n, score=score
-                )
-            window_fetch_tasks.append(fetch_window(original_chunk, rerank_result.score))
+        windows = await asyncio.to_thread(
+            self.repository.get_chunk_windows,
+            [self._chunk_window_item(rerank_result.artifact.metadata['original_chunk'], search_query)
+             for rerank_result in reranked_results]
+        )
+        # chunks and scores come from validated models, skip re-validating them per result
+        return [
+            ChunkSearchResult.model_construct(pre_n_chunks=pre_n, chunk=c, next_n_chunks=next_n, score=rerank_result.score)
+            for rerank_result, (pre_n, c, next_n) in zip(reranked_results, windows)
+        ]
 
-        return await asyncio.gather(*window_fetch_tasks)
+    @staticmethod
+    def _chunk_window_item(chunk: Chunk, search_query: ChunkSearchQuery) -> tuple:
+        """Build the (artifact_id, parent_id, chunk_index, pre_n, next_n) item for get_chunk_windows"""
+        return (chunk.chunk_metadata.artifact_id, chunk.chunk_metadata.parent_artifact_id,
+                chunk.chunk_metadata.chunk_index, search_query.pre_n, search_query.next_n)
 
     async def search_fulltext(self, query: str, limit: int = 10, filter_types: Optional[List[ArtifactType]] = None) -> \
     Optional[list[FulltextSearchResult]]:
@@ -1250,14 +2048,7 @@ class WorkSpace(BaseModel):
                 filter_dict["metadata.artifact_type"] = [t.value for t in filter_types]
 
             # Perform full-text search
-            search_results = await asyncio.to_thread(
-                self.fulltext_db.search,
-                self.full_text_index,
-                query,
-                filter=filter_dict,
-                limit=limit,
-                offset=0
-            )
+            search_results = await self._search_fulltext_db(query, filter=filter_dict, limit=limit)
 
             if not search_results:
                 logger.info("🔍 search_fulltext no results found")
@@ -1289,35 +2080,36 @@ class WorkSpace(BaseModel):
                 filter_dict["metadata.artifact_type"] = [t.value for t in search_query.filter_types]
             
             # Perform full-text search
-            search_results = await asyncio.to_thread(
-                self.fulltext_db.search,
-                self.full_text_index,
-                search_query.query,
-                filter=filter_dict,
-                limit=search_query.limit,
-                offset=0
+            search_results = await self._search_fulltext_db(
+                search_query.query, filter=filter_dict, limit=search_query.limit
             )
             
             if not search_results or not search_results.results:
                 logger.info("🔍 _fulltext_search_artifacts no results found")
                 return None
             
+            hits = [result for result in search_results.results
+                    if not self._excluded_by_type(result.artifact_id, search_query.filter_types)]
+            artifacts = self.get_artifacts([(result.artifact_id, None) for result in hits])
+
             results = []
-            existing_artifact_ids = []
+            existing_artifact_ids: set[str] = set()
             
-            for result in search_results.results:
+            for result in hits:
                 if result.artifact_id in existing_artifact_ids:
-                    logger.debug(f"🔍 _fulltext_search_artifacts artifact_id already exists: {result.artifact_id}")
+                    logger.debug("🔍 _fulltext_search_artifacts artifact_id already exists: %s", result.artifact_id)
                     continue
                     
-                artifact = self.get_artifact(result.artifact_id)
+                artifact = artifacts.get(result.artifact_id)
                 if not artifact:
                     logger.warning(f"🔍 _fulltext_search_artifacts artifact not found: {result.artifact_id}")
                     continue
+                if search_query.filter_types and artifact.artifact_type not in search_query.filter_types:
+                    continue
                     
-                logger.debug(f"🔍 _fulltext_search_artifacts artifact- {artifact.artifact_id} score: {result.score}")
-                results.append(HybridSearchResult(artifact=artifact, score=result.score))
-                existing_artifact_ids.append(result.artifact_id)
+                logger.debug("🔍 _fulltext_search_artifacts artifact- %s score: %s", artifact.artifact_id, result.score)
+                results.append(HybridSearchResult.model_construct(artifact=artifact, score=result.score))
+                existing_artifact_ids.add(result.artifact_id)
             
             logger.info(f"🔍 _fulltext_search_artifacts found {len(results)} results")
             return results
@@ -1340,11 +2132,15 @@ class WorkSpace(BaseModel):
         """
         if not isinstance(observer, WorkspaceObserver):
             raise TypeError("Observer must be an instance of WorkspaceObserver")
+        if id(observer) in self._observer_ids:
+            return
+        self._observer_ids.add(id(observer))
         self.observers.append(observer)
 
     def remove_observer(self, observer: WorkspaceObserver) -> None:
         """Remove an observer"""
-        if observer in self.observers:
+        if id(observer) in self._observer_ids:
+            self._observer_ids.discard(id(observer))
             self.observers.remove(observer)
 
     async def _notify_observers(self, operation: str, artifact: Artifact) -> List[Any]:
@@ -1358,23 +2154,20 @@ class WorkSpace(BaseModel):
         Returns:
             List of results from handlers
         """
+        if operation not in ("create", "update", "delete"):
+            return []
+        handler_name = f"on_{operation}"
+        notify_results = await asyncio.gather(
+            *[getattr(observer, handler_name)(workspace_id=self.workspace_id, artifact=artifact)
+              for observer in self.observers],
+            return_exceptions=True
+        )
         results = []
-        for observer in self.observers:
-            try:
-                if operation == "create":
-                    result = await observer.on_create(workspace_id=self.workspace_id, artifact=artifact)
-                    if result:
-                        results.append(result)
-                elif operation == "update":
-                    result = await observer.on_update(workspace_id=self.workspace_id, artifact=artifact)
-                    if result:
-                        results.append(result)
-                elif operation == "delete":
-                    result = await observer.on_delete(workspace_id=self.workspace_id, artifact=artifact)
-                    if result:
-                        results.append(result)
-            except Exception as e:
-                print(f"Observer notification failed: {e}")
+        for result in notify_results:
+            if isinstance(result, Exception):
+                logger.error(f"Observer notification failed: {result}")
+            elif result:
+                results.append(result)
         return results
 
 
@@ -1389,35 +2182,124 @@ class WorkSpace(BaseModel):
         This method is protected by a threading lock to prevent concurrent access
         from multiple threads that could lead to data corruption or race conditions.
         
+        Concurrent calls are coalesced: a call waiting for the lock returns without writing
+        when a save that started after it was requested already persisted its changes.
+        Inside batch_save() the write is deferred to the end of the block.
+
         Returns:
             None
         """
+        self._save_requests += 1
+        request = self._save_requests
+        if self._defer_save_depth:
+            return
         async with self._save_lock:
+            if self._saved_request >= request:
+                return
+            request = self._save_requests
+            # the index entries are kept in _artifact_metas and patched with the artifacts changed since the
+            # last save, they are only rebuilt from the artifacts once they were loaded or went out of sync
+            if not (isinstance(self.artifacts, LazyList) and not self.artifacts.loaded):
+                self._apply_dirty_artifact_metas()
+                if not self._artifact_metas_live or len(self._artifact_metas) != len(self.artifacts):
+                    self._artifact_metas = {a.artifact_id: (a.artifact_type_str, a.metadata) for a in self.artifacts}
+                    self._dirty_artifact_metas.clear()
+                    self._artifact_metas_live = True
+            # artifact entries are stored column-wise, one list per field instead of a dict per artifact
+            artifact_ids = list(self._artifact_metas)
+            artifact_types = [artifact_type for artifact_type, _ in self._artifact_metas.values()]
+            artifact_metadatas = [metadata for _, metadata in self._artifact_metas.values()]
             workspace_data = {
                 "workspace_id": self.workspace_id,
                 "name": self.name,
                 "created_at": self.created_at,
                 "updated_at": self.updated_at,
                 "metadata": self.metadata,
-                "artifact_ids": [a.artifact_id for a in self.artifacts],
-                "artifacts": [
-                    {
-                        "artifact_id": a.artifact_id,
-                        "type": str(a.artifact_type),
-                        "metadata": a.metadata,
-                        # "version": a.current_version
-                    } for a in self.artifacts
-                ]
+                "artifact_ids": artifact_ids,
+                "artifact_types": artifact_types,
+                "artifact_metadatas": artifact_metadatas,
             }
 
             logger.info(f"💼 save_workspace {self.workspace_id} start")
             # Store workspace information with workspace_id in metadata
-            self.repository.store_index(
+            await asyncio.to_thread(
+                self.repository.store_index,
                 index_data=workspace_data
             )
+            self._pending_refs = 0
+            self._tree_version += 1
+            _WORKSPACE_INDEX_CACHE.pop(self._index_location)
+            self._saved_request = request
 
             logger.info(f"💼 save_workspace {self.workspace_id} finished")
 
+    async def _save_artifact_ref(self, artifact_id: str, artifact: Optional[Artifact] = None) -> bool:
+        """
+        Patch a single artifact entry into the stored index instead of rewriting it, caller holds _save_lock
+
+        Args:
+            artifact_id: Artifact ID
+            artifact: The added/updated artifact, None if it was deleted
+
+        Returns:
+            False if the entry wasn't recorded and a full save() is needed
+        """
+        if self._defer_save_depth or self._pending_refs >= ARTIFACT_REF_COMPACT_THRESHOLD:
+            return False
+        if artifact_id not in self._dirty_artifact_metas:
+            # not a top-level artifact entry
+            return False
+        entry = (artifact.artifact_type_str, artifact.metadata) if artifact else None
+        try:
+            if entry:
+                recorded = await asyncio.to_thread(self.repository.append_artifact_ref, artifact_id,
+                                                   {"type": entry[0], "metadata": entry[1]}, self.updated_at)
+            else:
+                recorded = await asyncio.to_thread(self.repository.remove_artifact_ref, artifact_id, self.updated_at)
+        except Exception:
+            logger.exception("💼 save_workspace %s: record artifact %s failed", self.workspace_id, artifact_id)
+            return False
+        if not recorded:
+            return False
+        self._apply_dirty_artifact_metas()
+        self._pending_refs += 1
+        self._tree_version += 1
+        _WORKSPACE_INDEX_CACHE.pop(self._index_location)
+        return True
+
+    def _apply_dirty_artifact_metas(self) -> None:
+        """Patch the artifacts added, updated or deleted since the last save into _artifact_metas"""
+        for artifact_id, artifact in self._dirty_artifact_metas.items():
+            if artifact is None:
+                self._artifact_metas.pop(artifact_id, None)
+            else:
+                self._artifact_metas[artifact_id] = (artifact.artifact_type_str, artifact.metadata)
+        self._dirty_artifact_metas.clear()
+
+    async def compact(self) -> None:
+        """
+        Rewrite the full workspace index, folding in the artifact entries patched since the last full save
+        """
+        await self.save()
+
+    @asynccontextmanager
+    async def batch_save(self):
+        """
+        Defer workspace index writes for a bulk of mutations, the index is saved once when the block exits
+
+        Example:
+            async with workspace.batch_save():
+                for artifact in artifacts:
+                    await workspace.add_artifact(artifact)
+        """
+        self._defer_save_depth += 1
+        try:
+            yield self
+        finally:
+            self._defer_save_depth -= 1
+            if not self._defer_save_depth and self._saved_request < self._save_requests:
+                await self.save()
+
     
     def _load_workspace_data(self) -> Optional[Dict[str, Any]]:
         """
@@ -1426,64 +2308,157 @@ class WorkSpace(BaseModel):
         Returns:
             Dictionary containing workspace data if exists, None otherwise
         """
+        # 1. retrieve workspace index.json, reusing the cached index while it is unchanged
         try:
-            # 1. retrieve workspace index.json
-            index_data = self.repository.get_index_data()
-            if not index_data:
-                return None
-            workspace_data = index_data.get("workspace")
-            if not workspace_data:
-                return None
+            index_stat = self.repository.get_index_stat()
+            self._index_location = index_stat[0] if index_stat else None
+            cached = _WORKSPACE_INDEX_CACHE.get(self._index_location) if index_stat else None
+            if cached and cached[0] == index_stat[1]:
+                # decoding gives this workspace its own copy of the index
+                index_data = loads_json(cached[1])
+            else:
+                index_data = self.repository.get_index_data()
+                if index_stat and index_data:
+                    _WORKSPACE_INDEX_CACHE.put(index_stat[0], (index_stat[1], encode_json(index_data)))
+        except Exception:
+            logger.exception("💼 load workspace %s index failed", self.workspace_id)
+            return None
+        if not index_data:
+            return None
+        workspace_data = index_data.get("workspace")
+        if not workspace_data:
+            return None
 
-            # 2. retrieve all artifacts 
-            artifacts = []
+        # 2. artifacts are only retrieved on first access of workspace.artifacts
+        artifact_metas = {}
+        if "artifact_types" in workspace_data:
+            for artifact_id, artifact_type, metadata in zip(workspace_data.get("artifact_ids", []),
+                                                            workspace_data["artifact_types"],
+                                                            workspace_data.get("artifact_metadatas", [])):
+                if artifact_id:
+                    artifact_metas.setdefault(artifact_id, (artifact_type, metadata))
+        else:
+            # row-wise index written before the columnar layout
             for artifact_meta in workspace_data.get("artifacts", []):
                 artifact_id = artifact_meta.get("id") or artifact_meta.get("artifact_id")
-                if not artifact_id:
-                    continue
-                artifact_data = self.repository.retrieve_artifact(artifact_id)
-                from workspacex.artifacts.factory import ArtifactFactory
-                artifact = ArtifactFactory.from_dict(artifact_data)
-                if not artifact:
-                    continue
+                if artifact_id:
+                    artifact_metas.setdefault(artifact_id, (artifact_meta.get("type"), artifact_meta.get("metadata")))
+        artifact_ids = list(artifact_metas)
+        if artifact_ids and index_stat:
+            with _PREFETCH_LOCK:
+                prefetch = _PREFETCHED_INDEXES.get(index_stat[0]) != index_stat[1]
+                if prefetch:
+                    _PREFETCHED_INDEXES.put(index_stat[0], index_stat[1])
+            if prefetch:
+                # warm the backend in the background so the first access of the artifacts waits less on I/O
+                self._prefetch_future = _PREFETCH_EXECUTOR.submit(self.repository.prefetch_artifacts, artifact_ids)
+        artifacts = LazyList(partial(self._load_artifacts, artifact_ids))
+
+        return {
+            "artifacts": artifacts,
+            "artifact_metas": artifact_metas,
+            "metadata": workspace_data.get("metadata", {}),
+            "created_at": workspace_data.get("created_at"),
+            "updated_at": workspace_data.get("updated_at")
+        }
+
+    def _load_artifacts(self, artifact_ids: List[str]) -> List[Artifact]:
+        """
+        Retrieve and materialize the workspace artifacts in one batched repository call, keeping the index order
+
+        Args:
+            artifact_ids: Artifact IDs listed in the workspace index
+
+        Returns:
+            List of artifacts, artifacts that can't be retrieved or restored are skipped
+        """
+        from workspacex.artifacts.factory import ArtifactFactory
+        if self._prefetch_future:
+            # reading the artifacts now, a prefetch that didn't start yet is useless
+            self._prefetch_future.cancel()
+            self._prefetch_future = None
+        artifact_map = self._retrieve_artifact_map(artifact_ids)
+        if artifact_map is None:
+            return []
+
+        artifacts = []
+        for artifact_id in artifact_ids:
+            artifact_data = artifact_map.get(artifact_id)
+            if not artifact_data:
+                logger.warning("💼 load workspace %s: artifact %s not found", self.workspace_id, artifact_id)
+                continue
+            try:
+                # the index files were written by Artifact.to_dict, restore them without re-validating
+                artifact = ArtifactFactory.from_dict(artifact_data, trusted=True)
+            except Exception:
+                logger.exception("💼 load workspace %s: restore artifact %s failed", self.workspace_id, artifact_id)
+                continue
+            if artifact:
                 artifacts.append(artifact)
+        return artifacts
 
-            return {
-                "artifacts": artifacts,
-                "metadata": workspace_data.get("metadata", {}),
-                "created_at": workspace_data.get("created_at"),
-                "updated_at": workspace_data.get("updated_at")
-            }
-        except Exception as e:
-            traceback.print_exc()
-            print(f"Error loading workspace data: {e}")
+    def _retrieve_artifact_map(self, artifact_ids: List[str]) -> Optional[Dict[str, Any]]:
+        """Retrieve the artifact data of a workspace load, None if the repository failed"""
+        try:
+            return self.repository.retrieve_artifacts(artifact_ids, max_workers=LOAD_ARTIFACT_WORKERS)
+        except Exception:
+            logger.exception("💼 load workspace %s artifacts failed", self.workspace_id)
             return None
-        
+
     def generate_tree_data(self) -> Dict[str, Any]:
         """
-        Generate a tree structure based on artifacts and their sublist recursively.
+        Generate a tree structure based on artifacts and their (nested) sublists.
+
+        The tree is cached until the next artifact store or workspace save, callers must not mutate it.
+
         Returns:
             A dictionary representing the artifact tree.
         """
-        def build_node(artifact, parent_id="-1", depth=1):
-            node = {
-                "name": artifact.metadata.get('filename', artifact.artifact_id),
-                "id": artifact.artifact_id,
-                "type": str(artifact.artifact_type),
-                "artifactId": artifact.artifact_id,
-                "parentId": parent_id,
-                "depth": depth,
-                "expanded": False,
-                "children": []
-            }
-            for sub in getattr(artifact, 'sublist', []):
-                node["children"].append(build_node(sub, parent_id=artifact.artifact_id, depth=depth+1))
-            return node
+        if self._tree_cache and self._tree_cache[0] == self._tree_version:
+            return self._tree_cache[1]
 
+        artifacts = self.artifacts
         root = {
             "name": self.name,
             "id": "-1",
             "type": "workspace",
-            "children": [build_node(artifact) for artifact in self.artifacts]
+            "children": [None] * len(artifacts)
         }
+        # iterative walk, deep sublists can't hit the recursion limit; each node is written into its
+        # slot of the pre-sized children list of its parent
+        pending = deque((artifact, "-1", 1, root["children"], i) for i, artifact in enumerate(artifacts))
+        popleft, push = pending.popleft, pending.append
+        while pending:
+            artifact, parent_id, depth, siblings, position = popleft()
+            artifact_id = artifact.artifact_id
+            sublist = artifact.sublist or ()
+            children = [None] * len(sublist)
+            siblings[position] = {
+                "name": artifact.metadata.get('filename', artifact_id),
+                "id": artifact_id,
+                "type": artifact.artifact_type_str,
+                "artifactId": artifact_id,
+                "parentId": parent_id,
+                "depth": depth,
+                "expanded": False,
+                "children": children
+            }
+            for i, sub in enumerate(sublist):
+                push((sub, artifact_id, depth + 1, children, i))
+        self._tree_cache = (self._tree_version, root)
         return root
+
+    def generate_tree_data_bytes(self) -> bytes:
+        """
+        Generate the artifact tree serialized as JSON, ready to be sent as a response body.
+
+        The bytes are cached until the next artifact store or workspace save.
+
+        Returns:
+            UTF-8 encoded JSON of generate_tree_data()
+        """
+        if self._tree_bytes_cache and self._tree_bytes_cache[0] == self._tree_version:
+            return self._tree_bytes_cache[1]
+        blob = dumps_json(self.generate_tree_data())
+        self._tree_bytes_cache = (self._tree_version, blob)
+        return blob
@@ -1,5 +1,6 @@
+import asyncio
 import os
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from fastmcp import FastMCP, Context
 
@@ -18,14 +19,39 @@ class MCPConfig:
         # Priority: constructor param > env var > default
         self.workspace_id = os.getenv("WORKSPACE_ID", "test")
         self.workspace_type = os.getenv("WORKSPACE_TYPE", "local")
+        self.storage_path = os.getenv("WORKSPACE_STORAGE_PATH", None)
         self.threshold = os.getenv("SEARCH_THRESHOLD", 0.8)
-        self.filter_types = os.getenv("FILTER_TYPES", None)
+        # comma separated artifact types, parsed once instead of on every search
+        filter_types = os.getenv("FILTER_TYPES", None)
+        self.filter_types = tuple(ArtifactType(t.strip()) for t in filter_types.split(",")) if filter_types else None
         self.workspace_config = workspace_config or WorkspaceConfig()
-        
-        self._load_workspace()
+        self.workspace = None
+
+    @classmethod
+    async def create(cls, workspace_config: WorkspaceConfig = None) -> "MCPConfig":
+        """Create the configuration and load its workspace"""
+        config = cls(workspace_config)
+        await config._load_workspace()
+        return config
 
     async def _load_workspace(self):
-        self.workspace = await load_workspace(self.workspace_id, self.workspace_type, config=self.workspace_config)
+        self.workspace = await load_workspace(self.workspace_id, self.workspace_type, self.storage_path,
+                                              config=self.workspace_config)
+
+
+# loading the workspace opens the storage and the embedder/vector db clients, do it once per process
+_config: Optional[MCPConfig] = None
+_config_lock = asyncio.Lock()
+
+
+async def get_config() -> MCPConfig:
+    """Shared MCPConfig, created with its workspace on the first call"""
+    global _config
+    if _config is None:
+        async with _config_lock:
+            if _config is None:
+                _config = await MCPConfig.create()
+    return _config
 
 
 @mcp.tool
@@ -47,18 +73,12 @@ async def rag_search(
     Returns:
         Dict containing search results or error message
     """
-    config = MCPConfig()
-    
     try:
+        config = await get_config()
         # 使用Context进行HTTP请求
         await ctx.info(f"Searching for: {query}")
         
-        # 转换过滤类型（如果提供）
-        artifact_types = None
-        if config.filter_types:
-            artifact_types = [ArtifactType(t) for t in config.filter_types]
-        
-        results = await config.workspace.search_artifacts(query, limit, config.threshold, artifact_types)
+        results = await config.workspace.search_artifacts(query, limit, config.threshold, config.filter_types)
         
         await ctx.info(f"Found {len(results.get('results', []))} results")
         return results
@@ -68,5 +88,11 @@ async def rag_search(
         return {"error": f"Search failed: {str(e)}"}
 
 if __name__ == "__main__":
+    try:
+        # faster event loop for the proxied HTTP traffic, optional and unavailable on Windows
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     # 运行MCP服务器
     mcp.run()
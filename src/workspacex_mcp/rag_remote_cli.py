@@ -1,11 +1,15 @@
+import asyncio
 import os
 import traceback
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
 
 import aiohttp
 from fastmcp import FastMCP, Context
+from yarl import URL
 
-from workspacex.artifact import ArtifactType, ChunkSearchResult
+from workspacex.artifact import ChunkSearchResult
+from workspacex.storage.base import dumps_json, loads_json
+from workspacex.utils.cache import TTLCache
 from workspacex.utils.logger import logger
 
 # 创建FastMCP实例
@@ -20,7 +24,45 @@ class MCPConfig:
         self.workspace_id = os.getenv("WORKSPACE_ID", "test")
         self.api_base = os.getenv("WORKSPACE_API_BASE", "http://localhost:9588")
         self.threshold = float(os.getenv("WORKSPACE_SEARCH_THRESHOLD", 0.8))
+        # parsed once, aiohttp takes the URL object as is
+        self.search_url = URL(f"{self.api_base}/api/v1/workspaces/{self.workspace_id}/search_artifact_chunks")
+        # not sent yet, the search API doesn't accept filter types
         self.filter_types = os.getenv("WORKSPACE_FILTER_TYPES", None)
+        # fixed tail of the search request body (b'"threshold":0.8}'), only query and limit are encoded per call
+        self.search_body_tail = dumps_json({"threshold": self.threshold})[1:]
+
+
+# bytes of an error response body reported back to the caller
+ERROR_BODY_LIMIT = 4096
+SEARCH_CACHE_SIZE = 1024
+SEARCH_CACHE_TTL = 60
+
+_config: Optional[MCPConfig] = None
+# one session for all searches, its connection pool keeps the connections to the API alive between calls
+_session: Optional[aiohttp.ClientSession] = None
+# (query, limit) -> successful rag_search result, threshold and filter types are fixed per process
+_search_cache = TTLCache(maxsize=SEARCH_CACHE_SIZE, ttl=SEARCH_CACHE_TTL)
+# (query, limit) -> result future of the search request currently being sent
+_running_searches: Dict[Tuple[str, int], asyncio.Future] = {}
+
+
+async def get_config() -> MCPConfig:
+    """Shared MCPConfig, read from the environment on the first call"""
+    global _config
+    if _config is None:
+        _config = MCPConfig()
+    return _config
+
+
+def get_session() -> aiohttp.ClientSession:
+    """Shared HTTP session, (re)created on first use, must be called from the running event loop"""
+    global _session
+    if _session is None or _session.closed:
+        # keep idle connections longer than aiohttp's 15s default, MCP tool calls arrive in bursts with pauses
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=75, enable_cleanup_closed=True)
+        )
+    return _session
 
 @mcp.tool
 async def rag_search(
@@ -39,54 +81,96 @@ async def rag_search(
     Returns:
         Dict containing search results or error message
     """
-    config = MCPConfig()
-    
     try:
-        # 使用aiohttp进行HTTP请求
-        await ctx.info(f"Searching for: {query}")
-        
-        # 转换过滤类型（如果提供）
-        artifact_types = None
-        if config.filter_types:
-            artifact_types = [ArtifactType(t) for t in config.filter_types]
+        config = await get_config()
+    except Exception as e:
+        logger.error(f"Invalid MCP config: {str(e)}")
+        await ctx.error(f"Invalid MCP config: {str(e)}")
+        return {"error": f"Search failed: {str(e)}"}
+    cache_key = (query, limit)
+    cached = _search_cache.get(cache_key)
+    if cached is not None:
+        await ctx.info(f"Found cached results for: {query}")
+        return cached
+    # an identical search is already running, share its result instead of sending another request
+    running = _running_searches.get(cache_key)
+    if running is not None:
+        await ctx.info(f"Waiting for the running search for: {query}")
+        return await asyncio.shield(running)
+
+    future = asyncio.get_running_loop().create_future()
+    _running_searches[cache_key] = future
+    try:
+        result = await _search(config, query, limit, ctx)
+        future.set_result(result)
+        return result
+    finally:
+        _running_searches.pop(cache_key, None)
+        if not future.done():
+            future.set_result({"error": "Search failed: cancelled"})
+
+
+async def _search(config: MCPConfig, query: str, limit: int, ctx: Context) -> Dict[str, Any]:
+    """Send one search request to the workspace API, successful results are cached"""
+    searching = None
+    try:
+        # 使用aiohttp进行HTTP请求, the progress message is sent while the request is in flight
+        searching = asyncio.create_task(ctx.info(f"Searching for: {query}"))
         
         # 使用aiohttp进行异步HTTP请求
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                f"{config.api_base}/api/v1/workspaces/{config.workspace_id}/search_artifact_chunks",
-                json={
-                    "query": query,
-                    "limit": limit,
-                    "threshold": config.threshold,
-                    # "filter_types": [t.value for t in artifact_types] if artifact_types else None
-                }
-            ) as response:
-                status_code = response.status
-                if status_code != 200:
-                    error_text = await response.text()
-                    await ctx.error(f"Search failed with status {status_code}")
-                    return {"error": f"Search failed: {error_text}"}
-                
-                results = await response.json()
-                logger.info(f"Error during search: {results}")
-                content = f"<results>\n<description>Found {len(results)} results. </description>\n"
-                for i,result in enumerate(results):
-                    content += (
-                        f"<artifact_chunk_result>\n"
-                        f"<artifact_chunk_id>{result['chunk']['chunk_id']}</artifact_chunk_id>\n"
-                        f"<artifact_chunk_content>{result['chunk']['content']}</artifact_chunk_content>\n"
-                        f"<artifact_id>{result['chunk']['chunk_metadata']['artifact_id']}</artifact_id>\n"
-                        f"</artifact_chunk_result>\n"
-                    )
-                content += "</results>\n"
-                await ctx.info(f"Found {len(results)} results")
-                return {"result": content}
-    
+        async with get_session().post(
+            config.search_url,
+            # encoded/decoded with orjson when it is installed
+            data=b'{"query":' + dumps_json(query) + b',"limit":' + dumps_json(limit) + b',' + config.search_body_tail,
+            headers={"Content-Type": "application/json"}
+        ) as response:
+            status_code = response.status
+            if status_code != 200:
+                # only the head of the error page, the rest is dropped with the connection
+                error_text = (await response.content.read(ERROR_BODY_LIMIT)).decode("utf-8", errors="replace")
+                # a failed progress message must not hide the HTTP error
+                await asyncio.wait((searching,))
+                await ctx.error(f"Search failed with status {status_code}")
+                return {"error": f"Search failed: {error_text}"}
+            
+            body = await response.read()
+
+        # the connection is back in the pool, parse and format outside the response block
+        results = loads_json(body)
+        logger.info(f"Error during search: {results}")
+        content = "".join((
+            f"<results>\n<description>Found {len(results)} results. </description>\n",
+            *(
+                f"<artifact_chunk_result>\n"
+                f"<artifact_chunk_id>{chunk['chunk_id']}</artifact_chunk_id>\n"
+                f"<artifact_chunk_content>{chunk['content']}</artifact_chunk_content>\n"
+                f"<artifact_id>{chunk['chunk_metadata']['artifact_id']}</artifact_id>\n"
+                f"</artifact_chunk_result>\n"
+                for chunk in (result['chunk'] for result in results)
+            ),
+            "</results>\n",
+        ))
+        await searching
+        await ctx.info(f"Found {len(results)} results")
+        result = {"result": content}
+        _search_cache.put((query, limit), result)
+        return result
+
     except Exception as e:
-        logger.error(f"Error during search: {str(e)}, trace is {traceback.format_exc()}")
-        await ctx.error(f"Error during search: {str(e)}, trace is {traceback.format_exc()}")
+        if searching is not None:
+            # keep the messages in order without raising a failed progress message again
+            await asyncio.wait((searching,))
+        trace = traceback.format_exc()
+        logger.error(f"Error during search: {str(e)}, trace is {trace}")
+        await ctx.error(f"Error during search: {str(e)}, trace is {trace}")
         return {"error": f"Search failed: {str(e)}"}
 
 if __name__ == "__main__":
+    try:
+        # faster event loop for the proxied HTTP traffic, optional and unavailable on Windows
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     # 运行MCP服务器
     mcp.run()